@@ -13,15 +13,36 @@ Usage:
     python3 full_csv_sync.py --v2 <v2-csv-path>              # V2 only
     python3 full_csv_sync.py --v1 <v1-csv-path>              # V1 only
     python3 full_csv_sync.py --v2 <v2-csv-path> --dry-run    # Preview only
+    python3 full_csv_sync.py --v2 <v2-csv-path> --incremental  # Only re-fetch edited Notion pages
+    python3 full_csv_sync.py --v2 <v2> --v1 <v1> --skip-v1-overlap  # V1 only for people not in V2
 """
 import csv
+import email.utils
 import json
 import os
 import re
 import sys
+import threading
 import time
 import argparse
-import urllib.request
+import http.client
+import io
+import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+
+# orjson is optional — several times faster on large Notion payloads, and it
+# works on bytes directly. Falls back to the stdlib when not installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 # === Config ===
 NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
@@ -32,53 +53,216 @@ if not NOTION_TOKEN:
     sys.exit(1)
 
 
+# Retry policy for transient Notion errors (rate limit + gateway hiccups)
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5  # seconds — doubles each attempt: 0.5s, 1s, 2s, 4s, 8s
+RETRY_STATUSES = {429, 502, 503}
+NOTION_TIMEOUT = 30  # seconds per request — a stalled socket fails instead of hanging the run
+
+# Write concurrency: workers overlap request latency, the limiter keeps us
+# under Notion's documented ~3 requests/second average
+WRITE_WORKERS = 5
+NOTION_RATE_PER_SEC = 3
+
+# The only properties fetch_all_notion_clients reads. Their IDs are looked up
+# from the DB schema so queries can ask Notion to leave everything else out.
+NOTION_READ_PROPERTIES = [
+    "Task name", "Email", "Phone", "Client Address", "City", "State",
+    "Scheduling link", "Capability Requirements", "Onboarding Profile",
+]
+NEEDED_PROP_IDS = []  # filled by _record_property_ids() from main()
+
+# --incremental snapshot of Notion clients (contains client PII — gitignored)
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".notion_sync_state.json")
+
+
 # ============================================================================
 # Notion helpers
 # ============================================================================
 
+class RateLimiter:
+    """Token bucket shared across threads: acquire() blocks until a request
+    slot is free, refilling at `rate` tokens per second (monotonic clock).
+    Up to `capacity` requests may go out back-to-back after an idle spell."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = float(self.capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            # Not enough budget — wait for the next token (holding the lock
+            # keeps other threads queued behind us in arrival order)
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+            self.last = time.monotonic()
+
+
+# Every Notion call — reads, writes and retries — draws from this one bucket
+NOTION_LIMITER = RateLimiter(NOTION_RATE_PER_SEC, capacity=NOTION_RATE_PER_SEC)
+
+# One keep-alive connection to api.notion.com per thread, reused for every
+# call so we pay the TCP + TLS handshake once per thread instead of once per
+# request. (http.client connections are not safe to share across threads.)
+_thread_local = threading.local()
+
+
+def _notion_connection():
+    conn = getattr(_thread_local, "notion_conn", None)
+    if conn is None:
+        conn = _thread_local.notion_conn = http.client.HTTPSConnection("api.notion.com", timeout=NOTION_TIMEOUT)
+    return conn
+
+
+def _reset_notion_connection():
+    conn = getattr(_thread_local, "notion_conn", None)
+    if conn is not None:
+        conn.close()
+    _thread_local.notion_conn = None
+
+
+def _retry_after(resp, default):
+    """Seconds to wait from a Retry-After header — delta-seconds or an
+    HTTP-date — or `default` if it is missing or unparseable."""
+    value = resp.getheader("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
 def notion_request(method, url, body=None):
+    """Send a Notion API request over the shared keep-alive connection.
+    Every attempt waits its turn on NOTION_LIMITER. Retries 429/502/503 with
+    exponential backoff (honors Retry-After), and reconnects once if the
+    server dropped the idle connection.
+    Raises urllib.error.HTTPError on any other 4xx/5xx, same as urlopen did."""
     headers = {
         "Authorization": f"Bearer {NOTION_TOKEN}",
         "Notion-Version": "2022-06-28",
         "Content-Type": "application/json",
     }
-    data = json.dumps(body).encode() if body else None
-    req = urllib.request.Request(url, data=data, method=method, headers=headers)
-    resp = urllib.request.urlopen(req)
-    return json.loads(resp.read().decode())
+    data = _dumps(body) if body else None
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
 
+    retries = 0
+    reconnected = False
+    while True:
+        NOTION_LIMITER.acquire()
+        conn = _notion_connection()
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Server closed the keep-alive socket between requests (BadStatusLine,
+            # RemoteDisconnected, reset) or the read timed out — reopen once
+            _reset_notion_connection()
+            if reconnected:
+                raise
+            reconnected = True
+            continue
+        reconnected = False
+
+        if resp.status in RETRY_STATUSES and retries < MAX_RETRIES:
+            wait = _retry_after(resp, RETRY_BACKOFF * 2 ** retries)
+            retries += 1
+            print(f"    Notion returned {resp.status} — retry {retries}/{MAX_RETRIES}, waiting {wait:.1f}s...")
+            time.sleep(wait)
+            continue
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(payload))
+        return _loads(payload)
+
+
+def load_client_snapshot():
+    """Load (last_sync_ts, {page_id: client}) saved by the previous incremental run."""
+    try:
+        with open(STATE_PATH, "rb") as f:
+            state = _loads(f.read())
+    except (OSError, ValueError):
+        return None, {}
+    return state.get("last_sync_ts"), state.get("clients", {})
+
+
+def save_client_snapshot(clients_by_id):
+    """Persist the merged client snapshot plus the newest last_edited_time seen.
+    Written to a temp file and renamed so an interrupted run can't corrupt it."""
+    last_sync_ts = max((c["last_edited_time"] for c in clients_by_id.values()), default=None)
+    tmp_path = STATE_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps({"last_sync_ts": last_sync_ts, "clients": clients_by_id}))
+    os.replace(tmp_path, STATE_PATH)
+
+
+def fetch_all_notion_clients(incremental=False):
+    """Fetch all clients from Notion with their current field values.
+    Pages are fetched one after another: each next_cursor only exists once the
+    previous page has come back, so there is nothing to fetch ahead of time —
+    the keep-alive connection is what makes each page cheap.
+
+    With incremental=True, only pages edited since the last incremental run
+    are fetched and merged into the saved snapshot (STATE_PATH). Pages
+    archived in Notion since the snapshot was taken are not noticed — delete
+    the state file to force a full fetch."""
+    since, clients_by_id = load_client_snapshot() if incremental else (None, {})
+
+    url = f"https://api.notion.com/v1/databases/{NOTION_DB_ID}/query"
+    if NEEDED_PROP_IDS:
+        # Only return the properties we read — wide DBs shrink several-fold
+        url += "?" + "&".join(
+            f"filter_properties={urllib.parse.quote(pid, safe='%')}" for pid in NEEDED_PROP_IDS)
 
-def fetch_all_notion_clients():
-    """Fetch all clients from Notion with their current field values."""
     all_results = []
     cursor = None
     while True:
         body = {"page_size": 100}
+        if since:
+            body["filter"] = {"timestamp": "last_edited_time",
+                              "last_edited_time": {"on_or_after": since}}
+            body["sorts"] = [{"timestamp": "last_edited_time", "direction": "ascending"}]
         if cursor:
             body["start_cursor"] = cursor
-        data = notion_request("POST",
-            f"https://api.notion.com/v1/databases/{NOTION_DB_ID}/query", body)
+        data = notion_request("POST", url, body)
         all_results.extend(data.get("results", []))
         if data.get("has_more"):
             cursor = data["next_cursor"]
         else:
             break
 
-    clients = {}
+    if since:
+        print(f"  Incremental: {len(all_results)} pages edited since {since}")
+
     for page in all_results:
         props = page.get("properties", {})
         title_parts = props.get("Task name", {}).get("title", [])
-        name = "".join(t.get("plain_text", "") for t in title_parts).strip()
+        name = "".join([t.get("plain_text", "") for t in title_parts]).strip()
 
         # Extract current values
         email_val = props.get("Email", {}).get("email", "") or ""
         phone_val = props.get("Phone", {}).get("phone_number", "") or ""
 
         addr_rt = props.get("Client Address", {}).get("rich_text", [])
-        addr_val = "".join(t.get("plain_text", "") for t in addr_rt).strip()
+        addr_val = "".join([t.get("plain_text", "") for t in addr_rt]).strip()
 
         city_rt = props.get("City", {}).get("rich_text", [])
-        city_val = "".join(t.get("plain_text", "") for t in city_rt).strip()
+        city_val = "".join([t.get("plain_text", "") for t in city_rt]).strip()
 
         state_sel = props.get("State", {}).get("select")
         state_val = state_sel.get("name", "") if state_sel else ""
@@ -86,12 +270,12 @@ def fetch_all_notion_clients():
         sched_val = props.get("Scheduling link", {}).get("url", "") or ""
 
         cap_rt = props.get("Capability Requirements", {}).get("rich_text", [])
-        cap_val = "".join(t.get("plain_text", "") for t in cap_rt).strip()
+        cap_val = "".join([t.get("plain_text", "") for t in cap_rt]).strip()
 
         onb_rt = props.get("Onboarding Profile", {}).get("rich_text", [])
-        onb_val = "".join(t.get("plain_text", "") for t in onb_rt).strip()
+        onb_val = "".join([t.get("plain_text", "") for t in onb_rt]).strip()
 
-        clients[name.lower()] = {
+        clients_by_id[page["id"]] = {
             "page_id": page["id"],
             "name": name,
             "email": email_val,
@@ -102,52 +286,114 @@ def fetch_all_notion_clients():
             "scheduling_link": sched_val,
             "caps": cap_val,
             "onboarding_profile": onb_val,
+            "last_edited_time": page.get("last_edited_time", ""),
         }
 
+    if incremental:
+        save_client_snapshot(clients_by_id)
+
+    clients = {}
+    for client in clients_by_id.values():
+        clients[client["name"].lower()] = client
+
     return clients
 
 
-def find_match(notion_clients, first, last):
+_WORD_RE = re.compile(r"\w+")
+
+
+def build_name_index(notion_clients):
+    """Index Notion clients by full lowercased name and by each whole word in
+    the name, so matching a CSV row only regex-checks the clients that share a
+    word with it. Token lists keep Notion's order, so "first match wins"
+    behaves exactly like the old linear scan. `memo` caches find_match results
+    per (first, last) so a person seen in both the V1 and V2 passes is only
+    resolved once."""
+    by_token = {}
+    for client in notion_clients.values():
+        for token in set(_WORD_RE.findall(client["name"].lower())):
+            by_token.setdefault(token, []).append(client)
+    return {"by_exact": notion_clients, "by_token": by_token, "memo": {}}
+
+
+@lru_cache(maxsize=1024)
+def _word_re(term):
+    """Whole-word pattern for a (lowercased) name, compiled once per name."""
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+def _find_by_word(index, term):
+    """First client, in Notion order, whose name matches `term` as a whole
+    word. A name can only match if it has the term's leading word as one of
+    its words, so only those clients get the word-boundary regex check."""
+    words = _WORD_RE.findall(term)
+    if words and term.startswith(words[0]):
+        candidates = index["by_token"].get(words[0], [])
+    else:
+        candidates = index["by_exact"].values()
+    pattern = _word_re(term)
+    for client in candidates:
+        if pattern.search(client["name"].lower()):
+            return client
+    return None
+
+
+def find_match(index, first, last):
     """Match a CSV name to a Notion client using word-boundary matching.
     Prevents substring collisions like 'Craft' matching 'Beacraft'."""
+    key = (first.lower(), last.lower())
+    memo = index["memo"]
+    if key not in memo:
+        memo[key] = _resolve_match(index, first, last)
+    return memo[key]
+
+
+def _resolve_match(index, first, last):
     search = f"{first} {last}".strip().lower()
     # Exact
-    for k, v in notion_clients.items():
-        if search == k:
-            return v
+    exact = index["by_exact"].get(search)
+    if exact:
+        return exact
     # Last name — must match as a whole word
     if last and len(last) > 1:
-        pattern = re.compile(r'\b' + re.escape(last.lower()) + r'\b')
-        for k, v in notion_clients.items():
-            if pattern.search(k):
-                return v
+        match = _find_by_word(index, last.lower())
+        if match:
+            return match
     # First name — must match as a whole word
     if first and len(first) > 2:
-        pattern = re.compile(r'\b' + re.escape(first.lower()) + r'\b')
-        for k, v in notion_clients.items():
-            if pattern.search(k):
-                return v
+        return _find_by_word(index, first.lower())
     return None
 
 
-def create_onboarding_profile_property():
-    """Create 'Onboarding Profile' rich_text property in Notion DB if it doesn't exist."""
+def get_db_schema():
+    """GET the client database schema. main() fetches it once and hands it on."""
+    return notion_request("GET", f"https://api.notion.com/v1/databases/{NOTION_DB_ID}")
+
+
+def _record_property_ids(db):
+    """Remember the IDs of NOTION_READ_PROPERTIES from a database object."""
+    props = db.get("properties", {})
+    NEEDED_PROP_IDS[:] = [props[name]["id"] for name in NOTION_READ_PROPERTIES
+                          if "id" in props.get(name, {})]
+
+
+def create_onboarding_profile_property(db):
+    """Create 'Onboarding Profile' rich_text property in Notion DB if it doesn't exist.
+    Returns the database schema as it stands afterwards."""
     try:
-        db = notion_request("GET", f"https://api.notion.com/v1/databases/{NOTION_DB_ID}")
         if "Onboarding Profile" in db.get("properties", {}):
             print("  'Onboarding Profile' property already exists\n")
-            return True
+            return db
 
         print("  Creating 'Onboarding Profile' property in Notion...")
-        notion_request("PATCH",
+        db = notion_request("PATCH",
             f"https://api.notion.com/v1/databases/{NOTION_DB_ID}",
             {"properties": {"Onboarding Profile": {"rich_text": {}}}}
         )
         print("  Created!\n")
-        return True
     except Exception as e:
         print(f"  Error creating property: {e}")
-        return False
+    return db
 
 
 def update_notion_client(page_id, updates, dry_run=False):
@@ -232,6 +478,73 @@ AUTONOMY_MAP = {
     "between": "Somewhere in Between",
 }
 
+# Identity questions (Typeform spelling, curly apostrophe) — see build_v2_accessor
+V2_IDENTITY_COLS = {
+    "first": "What\u2019s your first name?",
+    "last": "What\u2019s your last name?",
+    "email": "What\u2019s your email address?",
+    "phone": "What\u2019s your phone number?",
+}
+
+# Pet type answer "I don't have any pets." is noise, not a detail
+V2_PET_TYPE_COL = "What type of pets?"
+
+# V2 onboarding profile: (label, CSV column) in the order lines are written
+V2_PROFILE_FIELDS = [
+    ("Household", "Tell us about your household members"),
+    ("Pets", "Do you have pets?"),
+    ("Pet Details", V2_PET_TYPE_COL),
+    ("Bedrooms/Baths", "How many bedrooms and bathrooms?"),
+    ("Sq Ft", "What's the total square footage of your home?"),
+    ("Current Support", "Do you currently have any household support?"),
+    ("Support Details", "Describe your current support and what they do"),
+    ("Keep/Transition", "Will you keep this support or transition it to your house manager?"),
+    ("Pain Points", "What are your top 3 pain points with home management right now?"),
+    ("Moving", "Are you moving soon?"),
+    ("Ideal Start", "What's your ideal start date for house assistant support?"),
+    ("Upcoming Travel", "Any upcoming travel or commitments in the next 2 months we should be aware of?"),
+    ("Weekday Routine", "What does a typical weekday look like for your household?"),
+    ("Work Schedules", "Tell us about work schedules for adults in the household"),
+    ("Kids Schedule", "What's your kids' school schedule?"),
+    ("After-School", "Are there regular after-school activities or commitments?"),
+    ("Weekend", "What does a typical weekend look like?"),
+    ("Trash/Recycling", "When does your trash/recycling service come?"),
+    ("Regular Vendors", "Do you have any other routine vendors or services that come regularly?"),
+    ("Preferred Hours", "When would you ideally want house management support to happen?"),
+    ("Off-Limits Times", "Are there times when you definitely DON'T want support?"),
+    ("Style Preferences", "Any other preferences about how someone shows up in your home?"),
+    ("Wellness/Fitness", "Are there any fitness or wellness routines we could support?"),
+    ("Chaotic Areas", "Are there parts of your home that feel chaotic or out of sync?"),
+    ("Recurring Friction", "What are the sources of recurring friction that additional support could resolve?"),
+    ("Restoration", "Is there anything specific that helps you feel restored and relaxed at home?"),
+    ("Special Considerations", "Are there any special household considerations we should know about?"),
+    ("Other Notes", "Anything else you want us to know?"),
+]
+
+
+# Profile answers that carry no information
+_SKIP = frozenset({"n/a", "none", "no", "0", ""})
+_SKIP_MAXLEN = max(len(v) for v in _SKIP)
+
+# Address line 2 placeholders (lowercased)
+_EMPTY_LINE2_VALUES = frozenset({"n/a", ".", "-", "none"})
+
+
+def _cell(row, idx, col):
+    """Value of `col` in a csv.reader row — "" if the column is missing from
+    the header (or None) or the row is short."""
+    i = idx.get(col)
+    return row[i] if i is not None and i < len(row) else ""
+
+
+def _profile_add(lines, label, value):
+    """Append 'label: value' to an onboarding profile unless the answer is empty/noise."""
+    v = value.strip() if value else ""
+    # Anything longer than the longest sentinel can't be one — skip the
+    # lowercase copy for the long free-text answers that dominate the CSV
+    if v and (len(v) > _SKIP_MAXLEN or v.lower() not in _SKIP):
+        lines.append(f"{label}: {v}")
+
 
 def extract_level(label):
     if not label:
@@ -253,89 +566,75 @@ def map_select(text, mapping):
     return None
 
 
-def parse_v2_row(row):
-    """Parse a V2 CSV row into structured data."""
-    fn = row.get("What\u2019s your first name?", "") or row.get("What's your first name?", "")
-    ln = row.get("What\u2019s your last name?", "") or row.get("What's your last name?", "")
-    fn = fn.strip()
-    ln = ln.strip()
+_ACCESSOR_CACHE = {}  # header tuple -> resolved V2 column names
+
+
+def build_v2_accessor(header):
+    """Resolve which spelling of each identity column this export uses.
+    Typeform exports the questions with a curly apostrophe, older/hand-edited
+    CSVs have a straight one — check the header once instead of trying both
+    on every row. The preference questions have long, editable titles, so
+    those are found by keyword (last matching column wins, as before).
+    Returns {logical_field: actual_column_name or None}; memoized per header
+    so a long-lived caller re-reading same-schema exports resolves it once."""
+    key = tuple(header)
+    cached = _ACCESSOR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    present = set(header)
+    cols = {}
+    for field, curly in V2_IDENTITY_COLS.items():
+        straight = curly.replace("\u2019", "'")
+        cols[field] = curly if curly in present or straight not in present else straight
+    cols["relational"] = next((c for c in reversed(header) if "Relational Presence" in c), None)
+    cols["autonomy"] = next((c for c in reversed(header) if "Decision Autonomy" in c), None)
+    _ACCESSOR_CACHE[key] = cols
+    return cols
+
+
+def parse_v2_row(row, idx, cols):
+    """Parse a V2 CSV row (a csv.reader list) into structured data.
+    `idx` maps column name -> position; `cols` comes from build_v2_accessor(header)."""
+    fn = _cell(row, idx, cols["first"]).strip()
+    ln = _cell(row, idx, cols["last"]).strip()
     if not fn:
         return None
 
-    email = (row.get("What\u2019s your email address?", "") or
-             row.get("What's your email address?", "")).strip()
-    phone = (row.get("What\u2019s your phone number?", "") or
-             row.get("What's your phone number?", "")).strip()
+    email = _cell(row, idx, cols["email"]).strip()
+    phone = _cell(row, idx, cols["phone"]).strip()
 
     address_parts = []
-    street = row.get("Street Address", "").strip()
-    line2 = row.get("Address Line 2", "").strip()
+    street = _cell(row, idx, "Street Address").strip()
+    line2 = _cell(row, idx, "Address Line 2").strip()
     if street:
         address_parts.append(street)
-    if line2 and line2.lower() not in ("n/a", ".", "-", "none"):
+    if line2 and line2.lower() not in _EMPTY_LINE2_VALUES:
         address_parts.append(line2)
     address = ", ".join(address_parts)
 
-    city = row.get("City", "").strip()
-    state = row.get("State", "").strip()
+    city = _cell(row, idx, "City").strip()
+    state = _cell(row, idx, "State").strip()
 
     # Capability levels
     caps = {}
     for csv_col, short in V2_CAPABILITY_COLS.items():
-        level = extract_level(row.get(csv_col, ""))
+        level = extract_level(_cell(row, idx, csv_col))
         if level and level != "N/A":
             caps[short] = level
-    cap_string = ", ".join(f"{k}: {v}" for k, v in caps.items())
+    cap_string = ", ".join([f"{k}: {v}" for k, v in caps.items()])
 
     # Preferences
-    relational = None
-    autonomy = None
-    for col, val in row.items():
-        if "Relational Presence" in col:
-            relational = map_select(val, RELATIONAL_MAP)
-        if "Decision Autonomy" in col:
-            autonomy = map_select(val, AUTONOMY_MAP)
+    relational = map_select(_cell(row, idx, cols["relational"]), RELATIONAL_MAP)
+    autonomy = map_select(_cell(row, idx, cols["autonomy"]), AUTONOMY_MAP)
 
     # Build onboarding profile from ALL the rich data
     profile_lines = []
-
-    def add(label, value):
-        v = value.strip() if value else ""
-        if v and v.lower() not in ("n/a", "none", "no", "0", ""):
-            profile_lines.append(f"{label}: {v}")
-
-    add("Household", row.get("Tell us about your household members", ""))
-    add("Pets", row.get("Do you have pets?", ""))
-    pet_type = row.get("What type of pets?", "").strip()
-    if pet_type and pet_type.lower() not in ("n/a", "i don't have any pets."):
-        add("Pet Details", pet_type)
-    add("Bedrooms/Baths", row.get("How many bedrooms and bathrooms?", ""))
-    add("Sq Ft", row.get("What's the total square footage of your home?", ""))
-    add("Current Support", row.get("Do you currently have any household support?", ""))
-    support_desc = row.get("Describe your current support and what they do", "")
-    if support_desc:
-        add("Support Details", support_desc)
-    add("Keep/Transition", row.get("Will you keep this support or transition it to your house manager?", ""))
-    add("Pain Points", row.get("What are your top 3 pain points with home management right now?", ""))
-    add("Moving", row.get("Are you moving soon?", ""))
-    add("Ideal Start", row.get("What's your ideal start date for house assistant support?", ""))
-    add("Upcoming Travel", row.get("Any upcoming travel or commitments in the next 2 months we should be aware of?", ""))
-    add("Weekday Routine", row.get("What does a typical weekday look like for your household?", ""))
-    add("Work Schedules", row.get("Tell us about work schedules for adults in the household", ""))
-    add("Kids Schedule", row.get("What's your kids' school schedule?", ""))
-    add("After-School", row.get("Are there regular after-school activities or commitments?", ""))
-    add("Weekend", row.get("What does a typical weekend look like?", ""))
-    add("Trash/Recycling", row.get("When does your trash/recycling service come?", ""))
-    add("Regular Vendors", row.get("Do you have any other routine vendors or services that come regularly?", ""))
-    add("Preferred Hours", row.get("When would you ideally want house management support to happen?", ""))
-    add("Off-Limits Times", row.get("Are there times when you definitely DON'T want support?", ""))
-    add("Style Preferences", row.get("Any other preferences about how someone shows up in your home?", ""))
-    add("Wellness/Fitness", row.get("Are there any fitness or wellness routines we could support?", ""))
-    add("Chaotic Areas", row.get("Are there parts of your home that feel chaotic or out of sync?", ""))
-    add("Recurring Friction", row.get("What are the sources of recurring friction that additional support could resolve?", ""))
-    add("Restoration", row.get("Is there anything specific that helps you feel restored and relaxed at home?", ""))
-    add("Special Considerations", row.get("Are there any special household considerations we should know about?", ""))
-    add("Other Notes", row.get("Anything else you want us to know?", ""))
+    for label, col in V2_PROFILE_FIELDS:
+        value = _cell(row, idx, col)
+        if col == V2_PET_TYPE_COL and value.strip().lower() == "i don't have any pets.":
+            continue
+        _profile_add(profile_lines, label, value)
 
     profile_text = "\n".join(profile_lines)
 
@@ -346,7 +645,7 @@ def parse_v2_row(row):
         "caps": cap_string,
         "relational": relational, "autonomy": autonomy,
         "onboarding_profile": profile_text,
-        "submitted": row.get("Submit Date (UTC)", "")[:10],
+        "submitted": _cell(row, idx, "Submit Date (UTC)")[:10],
     }
 
 
@@ -354,73 +653,70 @@ def parse_v2_row(row):
 # V1 CSV parsing (original onboarding form)
 # ============================================================================
 
-def parse_v1_row(row):
-    """Parse a V1 CSV row into structured data."""
-    fn = row.get("First name", "").strip()
-    ln = row.get("Last name", "").strip()
+# V1 onboarding profile: (label, CSV column) in the order lines are written
+V1_PROFILE_FIELDS = [
+    ("Household", "Family members (names of partners + ages of kids, if applicable)"),
+    ("Pets", "Pets (type, breed/size, care notes)"),
+    ("Pet Details", "Share here more about the breed/size and any useful specifics"),
+    ("Bedrooms/Baths", "How many bedrooms & bathrooms?"),
+    ("Sq Ft", "What is the total square footage?"),
+    ("Current Support", "Do you currently have any household support (cleaners, nanny, meal prep, etc.)? Please list."),
+    ("Moving", "Are you moving soon?"),
+    ("Move-In Date", "When is the move in date?"),
+    ("Travel Frequency", "How often do you travel (approx. # trips per year, typical duration)?"),
+    ("Grocery Delivery", "Do you already use grocery delivery (e.g., Instacart, Costco, Whole Foods)?"),
+    ("Recurring Routines", "Do you have any recurring routines in place already (e.g., cleaners every Friday, laundry pickup)?"),
+    ("Comm Platform", "What's your preferred communication platform?"),
+    ("Budget", "What's your hourly budget range for your house assistant? "),
+    ("Schedule Preference", "Would you prefer your house assistant to be:"),
+    ("Open to Full-Time", "Are you open to having this role full time in the future?"),
+    ("Open to Male HM", "Are you open to having a male home manager?"),
+    ("Desired Qualities", "Are there any particular qualities or characteristics you'd love to see in your future Home Manager?"),
+    ("Ideal Start", "Ideal start date for your house assistant:"),
+    ("Upcoming Travel", "Any upcoming travel or commitments we should be aware of during the next 2 months?"),
+    ("Payment Preference", "How do you like to handle payments?"),
+]
+
+
+def parse_v1_row(row, idx, skip_emails=frozenset()):
+    """Parse a V1 CSV row (a csv.reader list) into structured data.
+    `idx` maps column name -> position. Rows whose lowercased email is in
+    `skip_emails` are dropped (see --skip-v1-overlap)."""
+    fn = _cell(row, idx, "First name").strip()
+    ln = _cell(row, idx, "Last name").strip()
     if not fn:
         return None
 
-    tags = row.get("Tags", "")
+    tags = _cell(row, idx, "Tags")
     if "AI Generated" in tags:
         return None  # skip test data
 
-    email = row.get("Email", "").strip()
-    phone = row.get("Phone number", "").strip()
+    email = _cell(row, idx, "Email").strip()
+    if email and email.lower() in skip_emails:
+        return None
+    phone = _cell(row, idx, "Phone number").strip()
 
     address_parts = []
-    street = row.get("Address", "").strip()
-    line2 = row.get("Address line 2", "").strip()
+    street = _cell(row, idx, "Address").strip()
+    line2 = _cell(row, idx, "Address line 2").strip()
     if street:
         address_parts.append(street)
-    if line2 and line2.lower() not in ("n/a", ".", "-", "none", ""):
+    if line2 and line2.lower() not in _EMPTY_LINE2_VALUES:
         address_parts.append(line2)
     address = ", ".join(address_parts)
 
-    city = row.get("City/Town", "").strip()
-    state = row.get("State/Region/Province", "").strip()
+    city = _cell(row, idx, "City/Town").strip()
+    state = _cell(row, idx, "State/Region/Province").strip()
 
     # Scheduling link
-    sched = row.get("If you have 30 minutes scheduling link copy it below", "").strip()
+    sched = _cell(row, idx, "If you have 30 minutes scheduling link copy it below").strip()
     if sched and not sched.startswith("http"):
         sched = ""
 
     # Build onboarding profile
     profile_lines = []
-
-    def add(label, value):
-        v = value.strip() if value else ""
-        if v and v.lower() not in ("n/a", "none", "no", "0", ""):
-            profile_lines.append(f"{label}: {v}")
-
-    add("Household", row.get("Family members (names of partners + ages of kids, if applicable)", ""))
-    add("Pets", row.get("Pets (type, breed/size, care notes)", ""))
-    pet_details = row.get("Share here more about the breed/size and any useful specifics", "")
-    if pet_details:
-        add("Pet Details", pet_details)
-    add("Bedrooms/Baths", row.get("How many bedrooms & bathrooms?", ""))
-    add("Sq Ft", row.get("What is the total square footage?", ""))
-    add("Current Support", row.get("Do you currently have any household support (cleaners, nanny, meal prep, etc.)? Please list.", ""))
-    add("Moving", row.get("Are you moving soon?", ""))
-    move_date = row.get("When is the move in date?", "").strip()
-    if move_date and move_date != "0":
-        add("Move-In Date", move_date)
-    add("Travel Frequency", row.get("How often do you travel (approx. # trips per year, typical duration)?", ""))
-    add("Grocery Delivery", row.get("Do you already use grocery delivery (e.g., Instacart, Costco, Whole Foods)?", ""))
-    add("Recurring Routines", row.get("Do you have any recurring routines in place already (e.g., cleaners every Friday, laundry pickup)?", ""))
-    add("Comm Platform", row.get("What's your preferred communication platform?", ""))
-    add("Budget", row.get("What's your hourly budget range for your house assistant? ", ""))
-
-    pref = row.get("Would you prefer your house assistant to be:", "").strip()
-    if pref:
-        add("Schedule Preference", pref)
-
-    add("Open to Full-Time", row.get("Are you open to having this role full time in the future?", ""))
-    add("Open to Male HM", row.get("Are you open to having a male home manager?", ""))
-    add("Desired Qualities", row.get("Are there any particular qualities or characteristics you'd love to see in your future Home Manager?", ""))
-    add("Ideal Start", row.get("Ideal start date for your house assistant:", ""))
-    add("Upcoming Travel", row.get("Any upcoming travel or commitments we should be aware of during the next 2 months?", ""))
-    add("Payment Preference", row.get("How do you like to handle payments?", ""))
+    for label, col in V1_PROFILE_FIELDS:
+        _profile_add(profile_lines, label, _cell(row, idx, col))
 
     profile_text = "\n".join(profile_lines)
 
@@ -430,7 +726,7 @@ def parse_v1_row(row):
         "address": address, "city": city, "state": state,
         "scheduling_link": sched,
         "onboarding_profile": profile_text,
-        "submitted": row.get("Submit Date (UTC)", "")[:10],
+        "submitted": _cell(row, idx, "Submit Date (UTC)")[:10],
     }
 
 
@@ -438,15 +734,62 @@ def parse_v1_row(row):
 # Main sync logic
 # ============================================================================
 
-def sync_records(notion_clients, records, source_label, dry_run=False):
-    """Sync parsed records to Notion. Only fills empty fields."""
+def scan_v2_emails(path):
+    """Cheap pre-pass: the set of lowercased emails in a V2 CSV, reading only
+    the email and first-name columns. Rows parse_v2_row would drop (no first
+    name) are left out, since the V2 pass never syncs those people."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        idx = _column_index(header)
+        cols = build_v2_accessor(header)
+        if idx.get(cols["email"]) is None:
+            return frozenset()
+        emails = set()
+        for row in reader:
+            email = _cell(row, idx, cols["email"]).strip().lower()
+            if email and _cell(row, idx, cols["first"]).strip():
+                emails.add(email)
+        return frozenset(emails)
+
+
+def _column_index(header):
+    """Map CSV column name -> position (a repeated name keeps its last
+    position, same as csv.DictReader)."""
+    return {name: i for i, name in enumerate(header)}
+
+
+def collect_records(rows, parse_row):
+    """Parse, drop unusable rows, and dedup by email (or name) in a single pass,
+    keeping the latest submission per person. `rows` may be a lazy iterator.
+    Returns (records sorted by name, number of rows read)."""
+    by_key = {}
+    row_count = 0
+    for row in rows:
+        row_count += 1
+        r = parse_row(row)
+        if not r:
+            continue
+        key = r["email"] or f"{r['first']} {r['last']}"
+        prev = by_key.get(key)
+        if prev is None or r["submitted"] > prev["submitted"]:
+            by_key[key] = r
+    return sorted(by_key.values(), key=lambda x: (x["first"].lower(), x["last"].lower())), row_count
+
+
+def sync_records(name_index, records, source_label, dry_run=False):
+    """Sync parsed records to Notion. Only fills empty fields.
+    Matching and diffing run serially; the resulting PATCHes go out through a
+    small worker pool (notion_request paces them via NOTION_LIMITER), with
+    writes to the same page kept in record order. A dry run stays serial."""
     updated = 0
     skipped = 0
     not_found = 0
+    tasks = []  # (name, match, updates)
 
     for r in records:
         name = f"{r['first']} {r['last']}"
-        match = find_match(notion_clients, r["first"], r["last"])
+        match = find_match(name_index, r["first"], r["last"])
 
         if not match:
             print(f"  MISS  {name}")
@@ -482,13 +825,39 @@ def sync_records(notion_clients, records, source_label, dry_run=False):
             continue
 
         print(f"  SYNC  {name} -> {match['name']} (updating: {', '.join(updates.keys())})")
+        if dry_run:
+            # Nothing goes over the network, so preview inline under its SYNC line
+            update_notion_client(match["page_id"], updates, dry_run=True)
+            updated += 1
+            continue
+        tasks.append((name, match, updates))
+
+    def write(previous, page_id, updates):
+        # Two records can match the same client; the later one must land last
+        if previous is not None:
+            wait([previous])
+        return update_notion_client(page_id, updates)
+
+    futures = []
+    pending = {}  # page_id -> latest write future for that page
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        for _, match, updates in tasks:
+            page_id = match["page_id"]
+            future = executor.submit(write, pending.get(page_id), page_id, updates)
+            pending[page_id] = future
+            futures.append(future)
+
+    # Tally in submission order so the error lines come out deterministically
+    for (name, match, updates), future in zip(tasks, futures):
         try:
-            update_notion_client(match["page_id"], updates, dry_run=dry_run)
+            future.result()
             updated += 1
         except Exception as e:
-            print(f"    ERROR: {e}")
-
-        time.sleep(0.35)
+            print(f"    ERROR: {name}: {e}")
+            continue
+        # Keep the in-memory client current so a later pass (V2 after V1)
+        # sees these fields as filled without re-fetching the whole DB
+        match.update(updates)
 
     return updated, skipped, not_found
 
@@ -498,6 +867,12 @@ def main():
     parser.add_argument("--v2", help="Path to V2 CSV (capability levels form)")
     parser.add_argument("--v1", help="Path to V1 CSV (original onboarding form)")
     parser.add_argument("--dry-run", action="store_true", help="Preview only, don't write to Notion")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only fetch Notion pages edited since the last --incremental run "
+                             "(snapshot kept in .notion_sync_state.json)")
+    parser.add_argument("--skip-v1-overlap", action="store_true",
+                        help="With --v1 and --v2, skip V1 rows whose email also appears in the V2 CSV. "
+                             "Those clients then get no V1-only data (scheduling link, V1 profile)")
     args = parser.parse_args()
 
     if not args.v2 and not args.v1:
@@ -508,11 +883,13 @@ def main():
 
     # Step 1: Create Onboarding Profile property if needed
     print("[1] Ensuring 'Onboarding Profile' property exists...")
-    create_onboarding_profile_property()
+    db = create_onboarding_profile_property(get_db_schema())
+    _record_property_ids(db)  # lets fetch_all_notion_clients ask for just these
 
     # Step 2: Fetch all Notion clients
     print("[2] Fetching all Notion clients...")
-    notion_clients = fetch_all_notion_clients()
+    notion_clients = fetch_all_notion_clients(incremental=args.incremental)
+    name_index = build_name_index(notion_clients)
     print(f"  Found {len(notion_clients)} clients\n")
 
     total_updated = 0
@@ -522,49 +899,36 @@ def main():
     # Step 3: Process V1 CSV first (older data, V2 will overwrite if both exist)
     if args.v1:
         print(f"[3a] Processing V1 CSV: {args.v1}")
+        v2_emails = frozenset()
+        if args.skip_v1_overlap and args.v2:
+            v2_emails = scan_v2_emails(args.v2)
+            print(f"  Skipping V1 rows for {len(v2_emails)} emails present in V2")
         with open(args.v1, newline="") as f:
-            rows = list(csv.DictReader(f))
-        print(f"  {len(rows)} rows\n")
-
-        records = [r for r in (parse_v1_row(row) for row in rows) if r]
-        # Dedup by email
-        by_key = {}
-        for r in records:
-            key = r["email"] or f"{r['first']} {r['last']}"
-            if key not in by_key or r["submitted"] > by_key[key]["submitted"]:
-                by_key[key] = r
-        records = sorted(by_key.values(), key=lambda x: f"{x['first']} {x['last']}")
+            reader = csv.reader(f)
+            idx = _column_index(next(reader, []))
+            records, row_count = collect_records(reader, lambda row: parse_v1_row(row, idx, v2_emails))
+        print(f"  {row_count} rows\n")
         print(f"  {len(records)} unique records\n")
 
-        u, s, m = sync_records(notion_clients, records, "V1", dry_run=args.dry_run)
+        u, s, m = sync_records(name_index, records, "V1", dry_run=args.dry_run)
         total_updated += u
         total_skipped += s
         total_missing += m
         print(f"\n  V1: {u} updated, {s} skipped, {m} not found\n")
 
-        # Refresh Notion clients (fields may have been filled by V1)
-        if u > 0 and not args.dry_run:
-            print("  Refreshing Notion data after V1 sync...")
-            notion_clients = fetch_all_notion_clients()
-
     # Step 4: Process V2 CSV (newer data with capabilities)
     if args.v2:
         print(f"[3b] Processing V2 CSV: {args.v2}")
         with open(args.v2, newline="") as f:
-            rows = list(csv.DictReader(f))
-        print(f"  {len(rows)} rows\n")
-
-        records = [r for r in (parse_v2_row(row) for row in rows) if r]
-        # Dedup by email
-        by_key = {}
-        for r in records:
-            key = r["email"] or f"{r['first']} {r['last']}"
-            if key not in by_key or r["submitted"] > by_key[key]["submitted"]:
-                by_key[key] = r
-        records = sorted(by_key.values(), key=lambda x: f"{x['first']} {x['last']}")
+            reader = csv.reader(f)
+            header = next(reader, [])
+            idx = _column_index(header)
+            cols = build_v2_accessor(header)
+            records, row_count = collect_records(reader, lambda row: parse_v2_row(row, idx, cols))
+        print(f"  {row_count} rows\n")
         print(f"  {len(records)} unique records\n")
 
-        u, s, m = sync_records(notion_clients, records, "V2", dry_run=args.dry_run)
+        u, s, m = sync_records(name_index, records, "V2", dry_run=args.dry_run)
         total_updated += u
         total_skipped += s
         total_missing += m
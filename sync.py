@@ -7,13 +7,41 @@ agent consumption (job descriptions, trials, manual builds, endorsement packets)
 
 Can be run manually or as a cron job via GitHub Actions.
 Run with --verify to check data integrity across Notion client records.
+Run with --full to ignore .sync_state.json and re-sync every response.
+Run with --incremental to fetch only responses submitted since the last clean run
+(with --verify: only re-fetch Notion pages edited since the last such check; pages
+archived or deleted in Notion since then stay in the report until a plain --verify
+runs, which discards the snapshot).
 """
+import contextlib
+import email.utils
+import functools
+import hashlib
+import io
 import json
 import os
 import re
 import sys
-import urllib.request
+import threading
+import http.client
+import urllib.error
+import urllib.parse
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
+
+# orjson is optional — it works on bytes directly in both directions and is
+# several times faster on large Typeform pages. Falls back to the stdlib.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 # === Config (from environment variables) ===
 TYPEFORM_TOKEN = os.environ.get("TYPEFORM_TOKEN")
@@ -21,9 +49,42 @@ TYPEFORM_FORM_ID = os.environ.get("TYPEFORM_FORM_ID")
 NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
 NOTION_DB_ID = os.environ.get("NOTION_DB_ID")
 
+# Notion allows ~3 requests/second per integration, Typeform 2/second
+NOTION_RATE_PER_SEC = 3
+TYPEFORM_RATE_PER_SEC = 2
+WRITE_WORKERS = 3
+
+# Retry policy for transient API errors (rate limit + gateway hiccups)
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5  # seconds — doubles each attempt: 0.5s, 1s, 2s, 4s, 8s
+RETRY_STATUSES = {429, 502, 503}
+HTTP_TIMEOUT = 30  # seconds per request — a stalled socket fails instead of hanging the run
+
+TYPEFORM_HEADERS = {"Authorization": f"Bearer {TYPEFORM_TOKEN}"}
+NOTION_HEADERS = {
+    "Authorization": f"Bearer {NOTION_TOKEN}",
+    "Notion-Version": "2022-06-28",
+    "Content-Type": "application/json",
+}
+
+# Responses already synced with identical content are skipped on later runs.
+# Holds only response IDs and content hashes — no client data.
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sync_state.json")
+
+# --verify --incremental snapshot of Notion client pages (contains client PII —
+# gitignored and local only, never carried between Actions runs)
+VERIFY_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".notion_verify_cache.json")
+
 # Validate required env vars (verify mode only needs Notion creds, preflight needs none)
 VERIFY_MODE = "--verify" in sys.argv
 PREFLIGHT_MODE = "--preflight" in sys.argv
+FULL_MODE = "--full" in sys.argv
+INCREMENTAL_MODE = "--incremental" in sys.argv and not FULL_MODE
+
+# Incremental runs ask Typeform for responses since the last clean run minus
+# this margin, so clock skew or slow submissions at the boundary aren't missed
+# (the overlap is cheap — already-synced responses are skipped by hash)
+SINCE_OVERLAP_SECS = 3600
 if not VERIFY_MODE and not PREFLIGHT_MODE:
     missing = []
     for var_name in ["TYPEFORM_TOKEN", "TYPEFORM_FORM_ID", "NOTION_TOKEN", "NOTION_DB_ID"]:
@@ -52,6 +113,10 @@ CAPABILITY_FIELDS = {
     "TiSEMHP47IV0": "House Mgmt",
 }
 
+# Capability short names in output order, plus a set for a quick "any at all?" test
+_CAP_NAMES = tuple(CAPABILITY_FIELDS.values())
+_CAP_NAME_SET = frozenset(_CAP_NAMES)
+
 # Typeform field IDs for identity + preferences
 FIELD_FIRST_NAME = "o1y3GX8jj48E"
 FIELD_LAST_NAME = "KR7LISBiu7yD"
@@ -60,6 +125,12 @@ FIELD_RELATIONAL = "GrQyr8j5sFPl"
 FIELD_AUTONOMY = "l7riGwpkiDZK"
 FIELD_COMM_PREFERENCE = None  # Set after Typeform question is added — field ID TBD
 
+# Fields with a fixed meaning; anything else is a contact or profile field
+_KNOWN_FIELD_IDS = frozenset((
+    *CAPABILITY_FIELDS, FIELD_FIRST_NAME, FIELD_LAST_NAME, FIELD_EMAIL,
+    FIELD_RELATIONAL, FIELD_AUTONOMY,
+))
+
 # Communication preference mapping (Typeform choice label -> Notion select value)
 COMM_PREFERENCE_MAP = {
     "sms": "SMS",
@@ -159,28 +230,56 @@ PROFILE_NOTION_PROPERTIES = {
 # Helper functions
 # ============================================================================
 
+_NA_RE = re.compile(r"don't (?:have|need)", re.IGNORECASE)
+_LEVEL_RE = re.compile(r"Level (\d)")
+
+
+@functools.lru_cache(maxsize=256)
 def extract_level(label):
-    """Extract level number from choice label like 'Level 2: Full Household...'"""
+    """Extract level number from choice label like 'Level 2: Full Household...'
+    Cached — the form only has a handful of distinct level labels."""
     if not label:
         return None
-    lower = label.lower()
-    if "don't have" in lower or "don't need" in lower:
+    if _NA_RE.search(label):
         return "N/A"
-    match = re.match(r"Level (\d)", label)
+    match = _LEVEL_RE.match(label)
     if match:
         return f"L{match.group(1)}"
     return None
 
 
+_SELECT_TABLES = {}  # id(mapping) -> (mapping, pattern, keyword rank, values, results)
+
+
+def _select_table(mapping):
+    """Compile a keyword mapping into one regex that reports every keyword
+    occurrence (the lookahead lets matches overlap), plus the values in
+    mapping order and a cache of results by text. Mappings are module-level
+    constants, so this runs once each."""
+    table = _SELECT_TABLES.get(id(mapping))
+    if table is None or table[0] is not mapping:
+        keywords = list(mapping)
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        rank = {k: i for i, k in enumerate(keywords)}
+        table = _SELECT_TABLES[id(mapping)] = (mapping, pattern, rank, list(mapping.values()), {})
+    return table
+
+
 def map_select(text, mapping):
-    """Map a choice label to a Notion select value using keyword matching."""
+    """Map a choice label to a Notion select value using keyword matching.
+    When several keywords appear, the one listed first in the mapping wins."""
     if not text:
         return None
-    lower = text.lower()
-    for keyword, notion_value in mapping.items():
-        if keyword in lower:
-            return notion_value
-    return None
+    _, pattern, rank, values, results = _select_table(mapping)
+    if text in results:
+        return results[text]
+    best = None
+    for match in pattern.finditer(text.lower()):
+        i = rank[match.group(1)]
+        if best is None or i < best:
+            best = i
+    result = results[text] = values[best] if best is not None else None
+    return result
 
 
 def get_answer_value(answer):
@@ -204,7 +303,7 @@ def extract_answer_text(answer):
         return answer.get("choice", {}).get("label", "").strip()
     elif atype == "choices":
         labels = answer.get("choices", {}).get("labels", [])
-        return ", ".join(l for l in labels if l)
+        return ", ".join([l for l in labels if l])
     elif atype == "number":
         num = answer.get("number")
         if num is None:
@@ -221,29 +320,185 @@ def extract_answer_text(answer):
     return ""
 
 
+# PROFILE_ROUTING as a keyword mapping, so map_select can match every keyword
+# in one regex pass (earliest entry still wins)
+_PROFILE_ROUTES = {keyword: (internal_key, sub_label)
+                   for keyword, internal_key, sub_label in PROFILE_ROUTING}
+
+
+@functools.lru_cache(maxsize=4096)
 def route_answer_to_profile(title):
     """Route a Typeform question to the correct profile property via keyword matching.
-    Returns (internal_key, sub_label) or (None, None) if no match."""
-    if not title:
-        return None, None
-    lower = title.lower()
-    for keyword, internal_key, sub_label in PROFILE_ROUTING:
-        if keyword in lower:
-            return internal_key, sub_label
-    return None, None
+    Returns (internal_key, sub_label) or (None, None) if no match.
+    Cached — the same few dozen question titles recur in every response."""
+    return map_select(title, _PROFILE_ROUTES) or (None, None)
+
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+class RateLimiter:
+    """Token bucket shared across threads: acquire() blocks until a request
+    slot is free, refilling at `rate` tokens per second (monotonic clock).
+    Up to `capacity` requests may go out back-to-back after an idle spell."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = float(self.capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            # Not enough budget — wait for the next token (holding the lock
+            # keeps other threads queued behind us in arrival order)
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+            self.last = time.monotonic()
+
+
+# Every call to an API — reads, writes and retries — draws from its bucket
+NOTION_LIMITER = RateLimiter(NOTION_RATE_PER_SEC, capacity=NOTION_RATE_PER_SEC)
+TYPEFORM_LIMITER = RateLimiter(TYPEFORM_RATE_PER_SEC, capacity=TYPEFORM_RATE_PER_SEC)
+
+# One keep-alive connection per host per thread, reused for every call so we
+# pay the TCP + TLS handshake once instead of once per request.
+# (http.client connections are not safe to share across threads.)
+_thread_local = threading.local()
+
+
+def _connection(host):
+    conns = _thread_local.__dict__.setdefault("conns", {})
+    if host not in conns:
+        conns[host] = http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+    return conns[host]
+
+
+def _reset_connection(host):
+    conn = _thread_local.__dict__.get("conns", {}).pop(host, None)
+    if conn is not None:
+        conn.close()
+
+
+def _retry_after(resp, default):
+    """Seconds to wait from a Retry-After header — delta-seconds or an
+    HTTP-date — or `default` if it is missing or unparseable."""
+    value = resp.getheader("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def api_request(method, url, headers, limiter, body=None, validator=None):
+    """Send a request over this thread's keep-alive connection to the host
+    and return the parsed JSON. Every attempt waits its turn on `limiter`,
+    which only sleeps for whatever is left of the rate budget. Retries 429/502/503 with exponential backoff
+    (honors Retry-After), and reconnects once if the server dropped the idle
+    connection. Raises urllib.error.HTTPError on any other 4xx/5xx.
+    A POST that creates something (anything but a database query) is never
+    sent twice: once it has gone out, a dropped connection or a 502/503 is
+    raised instead of retried, since the server may already have acted on it.
+    With a validator dict the request is conditional: it sends
+    validator["etag"] as If-None-Match, returns None on 304 Not Modified,
+    and otherwise stores the response's ETag back into the dict."""
+    data = _dumps(body) if body is not None else None
+    if validator and validator.get("etag"):
+        headers = {**headers, "If-None-Match": validator["etag"]}
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    idempotent = method != "POST" or parts.path.endswith("/query")
+
+    retries = 0
+    reconnected = False
+    while True:
+        limiter.acquire()
+        conn = _connection(parts.netloc)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+        except (http.client.HTTPException, OSError):
+            # Server closed the idle keep-alive socket before we could send —
+            # nothing reached it, so reopen once and send again
+            _reset_connection(parts.netloc)
+            if reconnected:
+                raise
+            reconnected = True
+            continue
+        try:
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Sent, but no response (RemoteDisconnected, reset, read timeout).
+            # Safe to send again only if doing it twice can't duplicate anything
+            _reset_connection(parts.netloc)
+            if reconnected or not idempotent:
+                raise
+            reconnected = True
+            continue
+        reconnected = False
+
+        # A 429 was rejected before being processed; 502/503 may not have been
+        if (resp.status in RETRY_STATUSES and retries < MAX_RETRIES
+                and (idempotent or resp.status == 429)):
+            wait_s = _retry_after(resp, RETRY_BACKOFF * 2 ** retries)
+            retries += 1
+            print(f"  {parts.netloc} returned {resp.status} — retry {retries}/{MAX_RETRIES}, waiting {wait_s:.1f}s...")
+            time.sleep(wait_s)
+            continue
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(payload))
+        if validator is not None:
+            if resp.status == 304:
+                return None
+            validator["etag"] = resp.getheader("ETag")
+        return _loads(payload)
+
+
+def notion_request(method, path, body=None):
+    """Call the Notion API, e.g. notion_request("GET", f"/databases/{id}")."""
+    return api_request(method, f"https://api.notion.com/v1{path}", NOTION_HEADERS, NOTION_LIMITER, body)
+
+
+def typeform_request(path, validator=None):
+    """GET from the Typeform API, e.g. typeform_request(f"/forms/{id}")."""
+    return api_request("GET", f"https://api.typeform.com{path}", TYPEFORM_HEADERS, TYPEFORM_LIMITER,
+                       validator=validator)
 
 
 # ============================================================================
 # Typeform API functions
 # ============================================================================
 
-def fetch_form_definition():
-    """Fetch the Typeform form definition to get field IDs and question titles."""
+def fetch_form_definition(form_cache=None):
+    """Fetch the Typeform form definition to get field IDs and question titles.
+    form_cache (a dict kept in the sync state) holds the titles and ETag from
+    the last fetch; when the form hasn't changed, Typeform answers 304 and the
+    cached titles are used instead of downloading and parsing the form again."""
     global FORM_FIELD_TITLES
-    url = f"https://api.typeform.com/forms/{TYPEFORM_FORM_ID}"
-    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {TYPEFORM_TOKEN}"})
-    resp = urllib.request.urlopen(req)
-    form = json.loads(resp.read().decode())
+    if form_cache is None:
+        form_cache = {}
+    if form_cache.get("form_id") != TYPEFORM_FORM_ID or "titles" not in form_cache:
+        form_cache.clear()
+    validator = {"etag": form_cache.get("etag")}
+    form = typeform_request(f"/forms/{TYPEFORM_FORM_ID}", validator)
+    if form is None:
+        FORM_FIELD_TITLES.update(form_cache["titles"])
+        print(f"  Form unchanged — reusing {len(FORM_FIELD_TITLES)} cached field titles")
+        return
 
     for field in form.get("fields", []):
         FORM_FIELD_TITLES[field["id"]] = field.get("title", "")
@@ -252,65 +507,78 @@ def fetch_form_definition():
             FORM_FIELD_TITLES[sub["id"]] = sub.get("title", "")
 
     print(f"  Loaded {len(FORM_FIELD_TITLES)} field titles from form definition")
+    form_cache.clear()
+    if validator["etag"]:
+        form_cache.update(form_id=TYPEFORM_FORM_ID, etag=validator["etag"],
+                          titles=dict(FORM_FIELD_TITLES))
 
 
-def fetch_typeform_responses():
-    """Fetch all V2 typeform responses via API (both completed and partial).
-    Handles pagination — Typeform returns max 1000 per page, we use 100.
+# Response item keys used downstream (token is the pagination cursor)
+_RESPONSE_KEYS = ("response_id", "token", "submitted_at", "landed_at", "answers")
+
+
+def _fetch_response_stream(completed_flag, since=None):
+    """Fetch every page of one response stream (completed="true" or "false").
+    Handles pagination — Typeform returns max 1000 per page, and we ask for
+    the full 1000 to keep round trips (and 429s) to a minimum.
     Uses total_items from API response to know when all pages are fetched
     (short pages mid-stream don't mean we're done)."""
-    all_responses = []
-
-    for completed_flag in ["true", "false"]:
-        after_token = None
-        page = 0
-        total_items = None
-        fetched_count = 0
-        retries = 0
-        max_retries = 3
-        while True:
-            url = f"https://api.typeform.com/forms/{TYPEFORM_FORM_ID}/responses?page_size=100&completed={completed_flag}"
-            if after_token:
-                url += f"&after={after_token}"
-            req = urllib.request.Request(url, headers={"Authorization": f"Bearer {TYPEFORM_TOKEN}"})
-            try:
-                resp = urllib.request.urlopen(req)
-            except urllib.error.HTTPError as e:
-                if e.code == 429 and retries < max_retries:
-                    retries += 1
-                    wait = 10 * retries  # exponential-ish: 10s, 20s, 30s
-                    print(f"  Rate limited (429) — retry {retries}/{max_retries}, waiting {wait}s...")
-                    time.sleep(wait)
-                    continue
-                print(f"ERROR: Typeform API returned {e.code} for completed={completed_flag}")
-                if e.code == 403:
-                    print("  Token may be expired or revoked. Regenerate at:")
-                    print("  https://admin.typeform.com/user/tokens")
-                    print("  Then update TYPEFORM_TOKEN in GitHub Secrets.")
-                raise
-            data = json.loads(resp.read().decode())
-
-            # Typeform returns total_items on every page — use it to know when done
-            if total_items is None:
-                total_items = data.get("total_items", 0)
-
-            items = data.get("items", [])
-            for item in items:
-                item["_completed"] = (completed_flag == "true")
-            all_responses.extend(items)
-            fetched_count += len(items)
-            page += 1
-
-            # Stop when we've fetched all items or got an empty page
-            if fetched_count >= total_items or len(items) == 0:
-                break
-
-            # Get pagination token from last item
-            after_token = items[-1].get("token")
-            if not after_token:
-                break
-            time.sleep(0.35)
-        time.sleep(0.35)
+    responses = []
+    after_token = None
+    total_items = None
+    while True:
+        path = f"/forms/{TYPEFORM_FORM_ID}/responses?page_size=1000&completed={completed_flag}"
+        if since:
+            path += f"&since={since}"
+        if after_token:
+            path += f"&after={after_token}"
+        try:
+            # 429s are already retried with backoff inside api_request
+            data = typeform_request(path)
+        except urllib.error.HTTPError as e:
+            print(f"ERROR: Typeform API returned {e.code} for completed={completed_flag}")
+            if e.code == 403:
+                print("  Token may be expired or revoked. Regenerate at:")
+                print("  https://admin.typeform.com/user/tokens")
+                print("  Then update TYPEFORM_TOKEN in GitHub Secrets.")
+            raise
+
+        # Typeform returns total_items on every page — use it to know when done
+        if total_items is None:
+            total_items = data.get("total_items", 0)
+
+        # Keep only what the sync reads — metadata, hidden fields, variables
+        # etc. would otherwise stay in memory for every response of the run
+        completed = (completed_flag == "true")
+        items = [{key: item[key] for key in _RESPONSE_KEYS if key in item}
+                 for item in data.get("items", [])]
+        del data
+        for item in items:
+            item["_completed"] = completed
+        responses.extend(items)
+
+        # Stop when we've fetched all items or got an empty page
+        if len(responses) >= total_items or len(items) == 0:
+            break
+
+        # Get pagination token from last item
+        after_token = items[-1].get("token")
+        if not after_token:
+            break
+
+    return responses
+
+
+def fetch_typeform_responses(since=None):
+    """Fetch all V2 typeform responses via API (both completed and partial).
+    The two streams are fetched side by side — pages within a stream have to
+    follow each other (each cursor comes from the previous page), but the
+    streams don't depend on each other. TYPEFORM_LIMITER keeps the pair
+    within Typeform's rate limit.
+    With since (ISO 8601 UTC), only responses submitted after it are fetched."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        streams = [pool.submit(_fetch_response_stream, flag, since) for flag in ("true", "false")]
+        all_responses = [item for stream in streams for item in stream.result()]
 
     count = len(all_responses)
     completed = sum(1 for r in all_responses if r.get("_completed"))
@@ -318,15 +586,30 @@ def fetch_typeform_responses():
     return all_responses
 
 
+# Contact field classification by Typeform ref. Every alternative is a
+# zero-width lookahead test anchored at the start, so match() tries them in
+# order and the first rule that holds wins (group name = CONTACT_FIELDS key):
+#   street          — mentions street/address, but not "line"
+#   address_line_2  — line_2 / line-2 / address_line / address-line
+#   city            — mentions city, but not state
+#   state           — mentions state, but not city
+_REF_CLASSIFIER = re.compile(
+    r"(?P<street>(?!.*line)(?=.*(?:street|address)))"
+    r"|(?P<address_line_2>(?=.*(?:line[_-]2|address[_-]line)))"
+    r"|(?P<city>(?!.*state)(?=.*city))"
+    r"|(?P<state>(?!.*city)(?=.*state))",
+    re.DOTALL,
+)
+
+
+# Sample value that looks like a street address ("123 Main St")
+_ADDRESS_RE = re.compile(r'\d+.*\b(st|ave|dr|rd|blvd|ln|ct|way|pl|cir)\b', re.IGNORECASE)
+
+
 def discover_contact_fields(responses):
     """Discover contact info field IDs from response data (no form definition needed)."""
     global CONTACT_FIELDS
 
-    known_ids = set(CAPABILITY_FIELDS.keys()) | {
-        FIELD_FIRST_NAME, FIELD_LAST_NAME, FIELD_EMAIL,
-        FIELD_RELATIONAL, FIELD_AUTONOMY,
-    }
-
     # Collect unknown fields across first 50 responses for reliable discovery
     unknown_fields = {}
     for item in responses[:50]:
@@ -335,7 +618,7 @@ def discover_contact_fields(responses):
             ftype = answer.get("field", {}).get("type", "")
             atype = answer.get("type", "")
             ref = answer.get("field", {}).get("ref", "")
-            if fid and fid not in known_ids:
+            if fid and fid not in _KNOWN_FIELD_IDS:
                 value = get_answer_value(answer)
                 if fid not in unknown_fields:
                     unknown_fields[fid] = {
@@ -352,36 +635,29 @@ def discover_contact_fields(responses):
 
     # Auto-classify by answer type and ref keywords
     for fid, info in unknown_fields.items():
-        atype = info["answer_type"]
-        ref = info["ref"].lower()
-
         # Phone: distinct answer type
-        if atype == "phone_number":
+        if info["answer_type"] == "phone_number":
             CONTACT_FIELDS["phone"] = fid
+            continue
         # Address fields: check ref for keywords
-        elif ("street" in ref or "address" in ref) and "line" not in ref:
-            CONTACT_FIELDS["street"] = fid
-        elif "line_2" in ref or "line-2" in ref or "address_line" in ref or "address-line" in ref:
-            CONTACT_FIELDS["address_line_2"] = fid
-        elif ref == "city" or ("city" in ref and "state" not in ref):
-            CONTACT_FIELDS["city"] = fid
-        elif ref == "state" or ("state" in ref and "city" not in ref):
-            CONTACT_FIELDS["state"] = fid
+        match = _REF_CLASSIFIER.match(info["ref"].lower())
+        if match:
+            CONTACT_FIELDS[match.lastgroup] = fid
 
     # Fallback: if refs didn't help, try classifying by sample values
     if not CONTACT_FIELDS:
-        address_pattern = re.compile(r'\d+.*\b(st|ave|dr|rd|blvd|ln|ct|way|pl|cir)\b', re.IGNORECASE)
         for fid, info in unknown_fields.items():
             if fid in CONTACT_FIELDS.values():
                 continue
             if info["answer_type"] != "text":
                 continue
             for sample in info["samples"]:
-                if address_pattern.search(sample) and "street" not in CONTACT_FIELDS:
+                if _ADDRESS_RE.search(sample) and "street" not in CONTACT_FIELDS:
                     CONTACT_FIELDS["street"] = fid
                     break
 
     print(f"  Classified contact fields: {CONTACT_FIELDS}")
+    _build_field_dispatch()
     return bool(CONTACT_FIELDS)
 
 
@@ -389,21 +665,40 @@ def discover_contact_fields(responses):
 # Notion API functions
 # ============================================================================
 
+
+# Non-profile properties the sync writes, with the schema to create them with
+# on a fresh database (select options are added by Notion as values arrive)
+SYNC_PROPERTY_SCHEMAS = {
+    "Email": {"email": {}},
+    "Phone": {"phone_number": {}},
+    "Client Address": {"rich_text": {}},
+    "City": {"rich_text": {}},
+    "State": {"select": {}},
+    "Typeform Status": {"select": {"options": [
+        {"name": "Complete", "color": "green"},
+        {"name": "Partial", "color": "yellow"},
+    ]}},
+    "Hiring Stage": {"select": {}},
+    "Delivery Phase": {"select": {}},
+    "Capability Requirements": {"rich_text": {}},
+    "Relational Preference": {"select": {}},
+    "Decision Autonomy": {"select": {}},
+    "Partner email": {"email": {}},
+}
+
+
 def ensure_profile_properties():
-    """Create all structured profile properties in Notion DB if they don't exist."""
-    req = urllib.request.Request(
-        f"https://api.notion.com/v1/databases/{NOTION_DB_ID}",
-        headers={
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-        }
-    )
-    resp = urllib.request.urlopen(req)
-    db = json.loads(resp.read().decode())
+    """Create every property the sync writes (structured profile fields and
+    the contact/status/capability ones) if it doesn't exist — all in one PATCH."""
+    db = notion_request("GET", f"/databases/{NOTION_DB_ID}")
 
     existing = set(db.get("properties", {}).keys())
     to_create = {}
 
+    for notion_prop, schema in SYNC_PROPERTY_SCHEMAS.items():
+        if notion_prop not in existing:
+            to_create[notion_prop] = schema
+
     for notion_prop in PROFILE_NOTION_PROPERTIES.values():
         if notion_prop not in existing:
             to_create[notion_prop] = {"rich_text": {}}
@@ -422,34 +717,26 @@ def ensure_profile_properties():
         return True
 
     print(f"  Creating {len(to_create)} properties: {', '.join(to_create.keys())}")
-    body = json.dumps({"properties": to_create}).encode()
-    req = urllib.request.Request(
-        f"https://api.notion.com/v1/databases/{NOTION_DB_ID}",
-        data=body, method="PATCH",
-        headers={
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json"
-        }
-    )
-    urllib.request.urlopen(req)
+    notion_request("PATCH", f"/databases/{NOTION_DB_ID}", {"properties": to_create})
     print("  Created!")
     return True
 
 
+def _rt(parts):
+    """Plain text of a rich_text/title array. Most values are one fragment,
+    so that case skips the join."""
+    if len(parts) == 1:
+        return parts[0].get("plain_text", "")
+    return "".join([t.get("plain_text", "") for t in parts])
+
+
 def _extract_current_values(props):
     """Extract current field values from a Notion page's properties."""
     current = {
         "email": props.get("Email", {}).get("email", "") or "",
         "phone": props.get("Phone", {}).get("phone_number", "") or "",
-        "address": "".join(
-            t.get("plain_text", "")
-            for t in props.get("Client Address", {}).get("rich_text", [])
-        ).strip(),
-        "city": "".join(
-            t.get("plain_text", "")
-            for t in props.get("City", {}).get("rich_text", [])
-        ).strip(),
+        "address": _rt(props.get("Client Address", {}).get("rich_text", [])).strip(),
+        "city": _rt(props.get("City", {}).get("rich_text", [])).strip(),
         "state": (props.get("State", {}).get("select") or {}).get("name", ""),
     }
 
@@ -463,107 +750,182 @@ def _extract_current_values(props):
         props.get("Hiring Stage", {}).get("select") or {}
     ).get("name", "")
 
+    # Read the always-overwritten fields so unchanged values aren't re-sent
+    current["capabilities"] = _rt(props.get("Capability Requirements", {}).get("rich_text", [])).strip()
+    for key, notion_prop in (("relational", "Relational Preference"),
+                             ("autonomy", "Decision Autonomy"),
+                             ("comm_preference", "Communication Preference")):
+        current[key] = (props.get(notion_prop, {}).get("select") or {}).get("name", "")
+    current["partner_email"] = props.get("Partner email", {}).get("email", "") or ""
+
     # Read all profile properties
     for internal_key, notion_prop in PROFILE_NOTION_PROPERTIES.items():
-        rt = props.get(notion_prop, {}).get("rich_text", [])
-        current[internal_key] = "".join(
-            t.get("plain_text", "") for t in rt
-        ).strip()
+        current[internal_key] = _rt(props.get(notion_prop, {}).get("rich_text", [])).strip()
 
     return current
 
 
 def _get_notion_name(props):
     """Get the client name from Notion page properties."""
-    title_parts = props.get("Task name", {}).get("title", [])
-    return "".join([t.get("plain_text", "") for t in title_parts])
-
-
-def _query_notion(filter_body):
-    """Query Notion database with a filter. Returns list of (page_id, name, props)."""
-    body = json.dumps(filter_body).encode()
-    req = urllib.request.Request(
-        f"https://api.notion.com/v1/databases/{NOTION_DB_ID}/query",
-        data=body, method="POST",
-        headers={
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json"
-        }
-    )
+    return _rt(props.get("Task name", {}).get("title", []))
+
+
+def _query_clients_page(cursor=None, since=None, property_ids=None):
+    """POST one page (100, Notion's max) of the client database query,
+    optionally only pages edited on or after `since` (an ISO timestamp) and
+    only the properties in `property_ids`."""
+    body = {"page_size": 100}
+    if since:
+        body["filter"] = {"timestamp": "last_edited_time",
+                          "last_edited_time": {"on_or_after": since}}
+    if cursor:
+        body["start_cursor"] = cursor
+    path = f"/databases/{NOTION_DB_ID}/query"
+    if property_ids:
+        path += "?" + "&".join(
+            f"filter_properties={urllib.parse.quote(pid, safe='%')}" for pid in property_ids)
+    return notion_request("POST", path, body)
+
+
+def _property_ids(names):
+    """IDs of the named client database properties (those that exist), for
+    asking queries to leave every other property out."""
+    props = notion_request("GET", f"/databases/{NOTION_DB_ID}").get("properties", {})
+    return [props[name]["id"] for name in names if "id" in props.get(name, {})]
+
+
+def iter_notion_clients(since=None, property_ids=None):
+    """Yield every client page with all field values (or, with since, only
+    those edited since then; with property_ids, only those properties).
+    As soon as a page arrives the request for the next one is sent, so the
+    caller's work on the current page overlaps the next round trip."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_query_clients_page, None, since, property_ids)
+        while pending:
+            data = pending.result()
+            pending = None
+            if data.get("has_more"):
+                pending = executor.submit(_query_clients_page, data["next_cursor"], since, property_ids)
+            yield from data.get("results", [])
+
+
+def iter_cached_notion_clients(property_ids=None):
+    """Every client page, re-fetching only pages edited since the snapshot in
+    VERIFY_CACHE_PATH was taken and merging them into it. Pages archived or
+    deleted in Notion since then are not noticed; a plain --verify removes the
+    file so the next incremental check starts from a full fetch."""
     try:
-        resp = urllib.request.urlopen(req)
-        data = json.loads(resp.read().decode())
-        results = []
-        for r in data.get("results", []):
-            props = r.get("properties", {})
-            notion_name = _get_notion_name(props)
-            results.append((r["id"], notion_name, props))
-        return results
-    except Exception as e:
-        print(f"  Query error: {e}")
-        return []
-
-
-def find_notion_client(email, last_name, first_name, address=""):
-    """Find a client in Notion. Email-first, name fallback, spouse detection.
+        with open(VERIFY_CACHE_PATH, "rb") as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        cache = {}
+    since = cache.get("last_edited_time")
+    pages = cache.get("pages", {})
+
+    edited = 0
+    for page in iter_notion_clients(since, property_ids):
+        pages[page["id"]] = {key: page.get(key) for key in ("id", "last_edited_time", "properties")}
+        edited += 1
+    if since:
+        print(f"  Incremental: {edited} pages edited since {since}")
+
+    last_edited = max((page["last_edited_time"] or "" for page in pages.values()), default=None)
+    tmp_path = VERIFY_CACHE_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps({"last_edited_time": last_edited, "pages": pages}))
+    os.replace(tmp_path, VERIFY_CACHE_PATH)
+    return iter(pages.values())
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _word_re(term):
+    """Whole-word pattern for a (lowercased) name, compiled once per name."""
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+def load_notion_index():
+    """Fetch every Notion client once and index it for local matching, so
+    each Typeform record is matched with dict lookups instead of 1-2 Notion
+    queries. Entries are (page_id, notion_name, current_values, lowercased name)."""
+    index = {"by_email": {}, "by_word": {}, "all": []}
+    for page in iter_notion_clients():
+        _index_client(index, page)
+    print(f"  Indexed {len(index['all'])} Notion clients")
+    return index
+
+
+def _index_client(index, page):
+    """Add a Notion page object to the in-memory client index."""
+    props = page.get("properties", {})
+    name = _get_notion_name(props)
+    entry = (page["id"], name, _extract_current_values(props), name.lower())
+    index["all"].append(entry)
+    if entry[2]["email"]:
+        index["by_email"].setdefault(entry[2]["email"].lower(), entry)
+    for word in set(_WORD_RE.findall(entry[3])):
+        index["by_word"].setdefault(word, []).append(entry)
+
+
+def find_notion_client(index, email, last_lc, first_lc, address="", log=None):
+    """Find a client in the Notion index. Email-first, name fallback, spouse detection.
+    Names come in already lowercased (the record's last_lc / first_lc).
+    Match lines are printed to log (stdout if None).
 
     Returns (page_id, notion_name, current_values, match_type) where match_type is:
-    - "email" — exact email match
+    - "email" — email match (ignoring case)
     - "name" — both first and last name match
     - "spouse" — last name + address match (different first name = spouse)
     - None — no match found
     """
-    # Step 1: Search by email (exact match — most reliable)
+    # Step 1: Look up by email (most reliable). Case-insensitive, like the
+    # Notion "equals" filter this replaced
     if email:
-        results = _query_notion({
-            "filter": {"property": "Email", "email": {"equals": email}},
-            "page_size": 1,
-        })
-        if results:
-            page_id, notion_name, props = results[0]
-            print(f"  Matched by email: {notion_name}")
-            return page_id, notion_name, _extract_current_values(props), "email"
-        time.sleep(0.35)
-
-    # Step 2 & 3: Search by last name — check for exact name match OR spouse match
-    if last_name:
-        results = _query_notion({
-            "filter": {"property": "Task name", "title": {"contains": last_name}},
-            "page_size": 20,
-        })
-        time.sleep(0.35)
+        entry = index["by_email"].get(email.lower())
+        if entry:
+            page_id, notion_name, current, _ = entry
+            print(f"  Matched by email: {notion_name}", file=log)
+            return page_id, notion_name, current, "email"
+
+    # Step 2 & 3: Candidates sharing the last name — check for exact name match OR spouse match
+    if last_lc:
+        # A whole-word match on the last name means its leading word is one of
+        # the name's words, so only those clients need the regex check
+        words = _WORD_RE.findall(last_lc)
+        if words and last_lc.startswith(words[0]):
+            candidates = index["by_word"].get(words[0], [])
+        else:
+            candidates = index["all"]
 
         spouse_candidate = None
+        last_re = _word_re(last_lc)
+        first_re = first_lc and _word_re(first_lc)
+
+        for page_id, notion_name, current, notion_lower in candidates:
+            has_last = bool(last_re.search(notion_lower))
+            has_first = bool(first_re and first_re.search(notion_lower))
+
+            if has_first and has_last:
+                # Step 2: exact name match
+                print(f"  Matched by name: {notion_name}", file=log)
+                return page_id, notion_name, current, "name"
+
+            if has_last and not has_first and address:
+                # Potential spouse: same last name, different first name
+                # Check if address matches
+                existing_addr = current.get("address", "").lower().strip()
+                new_addr = address.lower().strip()
 
-        if results:
-            for page_id, notion_name, props in results:
-                notion_lower = notion_name.lower()
-                has_last = bool(re.search(
-                    r'\b' + re.escape(last_name.lower()) + r'\b', notion_lower))
-                has_first = bool(first_name and re.search(
-                    r'\b' + re.escape(first_name.lower()) + r'\b', notion_lower))
-
-                if has_first and has_last:
-                    # Step 2: exact name match
-                    print(f"  Matched by name: {notion_name}")
-                    return page_id, notion_name, _extract_current_values(props), "name"
-
-                if has_last and not has_first and address:
-                    # Potential spouse: same last name, different first name
-                    # Check if address matches
-                    current = _extract_current_values(props)
-                    existing_addr = current.get("address", "").lower().strip()
-                    new_addr = address.lower().strip()
-
-                    if existing_addr and new_addr and _addresses_match(existing_addr, new_addr):
-                        spouse_candidate = (page_id, notion_name, current)
-
-            # Step 3: spouse match (last name + address)
-            if spouse_candidate:
-                page_id, notion_name, current = spouse_candidate
-                print(f"  SPOUSE MATCH: same last name + same address as '{notion_name}'")
-                return page_id, notion_name, current, "spouse"
+                if existing_addr and new_addr and _addresses_match(existing_addr, new_addr):
+                    spouse_candidate = (page_id, notion_name, current)
+
+        # Step 3: spouse match (last name + address)
+        if spouse_candidate:
+            page_id, notion_name, current = spouse_candidate
+            print(f"  SPOUSE MATCH: same last name + same address as '{notion_name}'", file=log)
+            return page_id, notion_name, current, "spouse"
 
     return None, None, {}, None
 
@@ -614,7 +976,8 @@ def _extract_unit(address):
 
 def create_notion_client(record):
     """Create a new client row in Notion from a Typeform response.
-    Only creates for completed responses with at least a name and email."""
+    Only creates for completed responses with at least a name and email.
+    Returns the created page object."""
     name = record["name"]
     if not name:
         return None
@@ -662,28 +1025,61 @@ def create_notion_client(record):
                 "rich_text": [{"text": {"content": value[:2000]}}]
             }
 
-    body = json.dumps({
+    return notion_request("POST", "/pages", {
         "parent": {"database_id": NOTION_DB_ID},
         "properties": properties,
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://api.notion.com/v1/pages",
-        data=body, method="POST",
-        headers={
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json"
-        }
-    )
+    })
+
+
+# Notion property name -> key in _extract_current_values()
+_CURRENT_VALUE_KEYS = {
+    "Email": "email",
+    "Phone": "phone",
+    "Client Address": "address",
+    "City": "city",
+    "State": "state",
+    "Typeform Status": "typeform_status",
+    "Hiring Stage": "hiring_stage",
+    "Capability Requirements": "capabilities",
+    "Relational Preference": "relational",
+    "Decision Autonomy": "autonomy",
+    "Communication Preference": "comm_preference",
+    "Partner email": "partner_email",
+    **{notion_prop: key for key, notion_prop in PROFILE_NOTION_PROPERTIES.items()},
+}
+
+
+def _property_value(prop):
+    """The plain value of a property we are about to write, in the same form
+    _extract_current_values() reads it back."""
+    if "rich_text" in prop:
+        return "".join([t["text"]["content"] for t in prop["rich_text"]]).strip()
+    if "select" in prop:
+        return prop["select"]["name"]
+    return prop.get("email") or prop.get("phone_number") or ""
 
-    resp = urllib.request.urlopen(req)
-    result = json.loads(resp.read().decode())
-    return result.get("id")
+
+def _changed_properties(properties, current_values):
+    """Drop properties whose value already matches Notion."""
+    return {
+        notion_prop: prop for notion_prop, prop in properties.items()
+        if notion_prop not in _CURRENT_VALUE_KEYS
+        or _property_value(prop) != current_values.get(_CURRENT_VALUE_KEYS[notion_prop], "")
+    }
 
 
-def update_notion(page_id, record, current_values):
-    """Update Notion client record with typeform data."""
+def _apply_written_values(current_values, properties):
+    """Mirror a PATCH into the cached current values, so later records
+    matching the same client see what was just written."""
+    for notion_prop, prop in properties.items():
+        key = _CURRENT_VALUE_KEYS.get(notion_prop)
+        if key:
+            current_values[key] = _property_value(prop)
+
+
+def build_notion_update(record, current_values):
+    """Build the Notion properties to write for a Typeform record, or {} if
+    there is nothing beyond the status to write."""
     properties = {}
 
     # Contact info — only fill if currently empty in Notion
@@ -728,7 +1124,11 @@ def update_notion(page_id, record, current_values):
             continue
 
         if is_spouse and existing:
-            # Spouse merge: append new data to existing, separated by newline
+            # Spouse merge: append new data to existing, separated by newline —
+            # unless an earlier run already appended it (a re-sync would
+            # otherwise PATCH the same answer on again every time)
+            if value in existing:
+                continue
             merged = f"{existing}\n{value}"
             properties[notion_prop] = {
                 "rich_text": [{"text": {"content": merged[:2000]}}]
@@ -758,30 +1158,80 @@ def update_notion(page_id, record, current_values):
 
     if len(properties) <= 1:
         # Only has status, no actual data — skip
-        return False, []
-
-    # Track what we're writing for logging
-    written_fields = [k for k in properties if k != "Typeform Status"]
-
-    body = json.dumps({"properties": properties}).encode()
-    req = urllib.request.Request(
-        f"https://api.notion.com/v1/pages/{page_id}",
-        data=body, method="PATCH",
-        headers={
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json"
-        }
-    )
+        return {}
+    return properties
+
 
-    urllib.request.urlopen(req)
-    return True, written_fields
+def patch_notion_page(page_id, properties):
+    """PATCH properties onto a Notion page."""
+    notion_request("PATCH", f"/pages/{page_id}", {"properties": properties})
+
+
+def _patch_after(previous, page_id, properties):
+    """Pool task: PATCH a page once any earlier write to the same page has
+    finished, so two writes to one client never land out of order."""
+    if previous is not None:
+        wait([previous])
+    patch_notion_page(page_id, properties)
 
 
 # ============================================================================
 # Response parsing
 # ============================================================================
 
+_FIELD_DISPATCH = {}  # field ID -> slot name in parse_response
+_WS_RE = re.compile(r'\s+')
+
+
+def _build_field_dispatch():
+    """Map every field ID parse_response reads directly to its slot:
+    identity/preference names, the capability short name, or the
+    CONTACT_FIELDS key. Rebuilt whenever CONTACT_FIELDS changes."""
+    dispatch = dict(CAPABILITY_FIELDS)
+    dispatch.update({
+        FIELD_FIRST_NAME: "first",
+        FIELD_LAST_NAME: "last",
+        FIELD_EMAIL: "email",
+        FIELD_RELATIONAL: "relational",
+        FIELD_AUTONOMY: "autonomy",
+    })
+    dispatch.update({fid: key for key, fid in CONTACT_FIELDS.items()})
+    if FIELD_COMM_PREFERENCE:
+        dispatch[FIELD_COMM_PREFERENCE] = "comm_preference"
+    _FIELD_DISPATCH.clear()
+    _FIELD_DISPATCH.update(dispatch)
+
+
+_build_field_dispatch()
+
+
+# Slots that can't make a record worth syncing on their own (see has_data)
+_NAME_ONLY_SLOTS = frozenset({"first", "last", "state", "comm_preference"})
+
+
+def _log_no_data(first_name, last_name, completed, email, phone, cap_string, address):
+    if not completed:
+        name = f"{first_name} {last_name}".strip()
+        print(f"  [debug] Partial '{name}' skipped (no data): email={email}, phone={phone}, "
+              f"caps={bool(cap_string)}, addr={bool(address)}")
+
+
+# Shared stand-in for a missing answer — only ever read, never mutated
+_NO_ANSWER = {}
+
+# Placeholder answers (lowercased) that carry no information
+_EMPTY_LINE2_VALUES = frozenset({"n/a", ".", "-", "none"})
+_SKIP_PROFILE_VALUES = frozenset({"n/a", "none", "0", "i don't have any pets."})
+
+
+def _choice_label(answer):
+    """Label of a choice answer, or "" if the question wasn't answered."""
+    if answer is None:
+        return ""
+    choice = answer.get("choice")
+    return choice.get("label", "") if choice else ""
+
+
 def parse_response(item):
     """Parse a single typeform response into structured data."""
     answers = item.get("answers", [])
@@ -789,99 +1239,86 @@ def parse_response(item):
     response_id = item.get("response_id", "")
     completed = item.get("_completed", True)
 
-    # Build lookup by field ID
-    answer_map = {}
+    # One pass over the answers: known fields land in their slot (a later
+    # answer to the same field wins), everything else is profile material
+    slots = {}
+    profile_answers = []
     for a in answers:
-        fid = a.get("field", {}).get("id", "")
-        answer_map[fid] = a
+        fid = a.get("field", _NO_ANSWER).get("id", "")
+        slot = _FIELD_DISPATCH.get(fid)
+        if slot is not None:
+            slots[slot] = a
+        elif fid:
+            profile_answers.append((fid, a))
 
     # Extract identity
-    first_name = answer_map.get(FIELD_FIRST_NAME, {}).get("text", "").strip()
-    last_name = answer_map.get(FIELD_LAST_NAME, {}).get("text", "").strip()
-    email = answer_map.get(FIELD_EMAIL, {}).get("email", "").strip()
+    first_name = slots.get("first", _NO_ANSWER).get("text", "").strip()
+    last_name = slots.get("last", _NO_ANSWER).get("text", "").strip()
+    email = slots.get("email", _NO_ANSWER).get("email", "").strip()
 
     # Need at least a name to match against Notion
     if not first_name and not last_name:
         if not completed:
-            field_ids = list(answer_map.keys())
+            field_ids = list(dict.fromkeys(a.get("field", {}).get("id", "") for a in answers))
             print(f"  [debug] Partial response skipped (no name): {len(answers)} answers, "
                   f"email={email or '(none)'}, fields={field_ids[:5]}")
         return None
 
-    # Extract contact info (dynamically discovered fields)
-    phone = ""
-    if "phone" in CONTACT_FIELDS:
-        phone = get_answer_value(answer_map.get(CONTACT_FIELDS["phone"], {}))
-
-    street = ""
-    if "street" in CONTACT_FIELDS:
-        street = get_answer_value(answer_map.get(CONTACT_FIELDS["street"], {}))
+    # Nothing answered beyond the name (state and comm preference alone don't
+    # count as data) — skip the extraction work below
+    if not profile_answers and slots.keys() <= _NAME_ONLY_SLOTS:
+        _log_no_data(first_name, last_name, completed, "", "", "", "")
+        return None
 
-    line2 = ""
-    if "address_line_2" in CONTACT_FIELDS:
-        line2 = get_answer_value(answer_map.get(CONTACT_FIELDS["address_line_2"], {}))
+    # Extract contact info (dynamically discovered fields)
+    phone = get_answer_value(slots.get("phone", _NO_ANSWER))
+    street = get_answer_value(slots.get("street", _NO_ANSWER))
+    line2 = get_answer_value(slots.get("address_line_2", _NO_ANSWER))
 
     # Combine address parts
     address_parts = []
     if street:
         address_parts.append(street)
-    if line2 and line2.lower() not in ("n/a", ".", "-", "none"):
+    if line2 and line2.lower() not in _EMPTY_LINE2_VALUES:
         address_parts.append(line2)
     address = ", ".join(address_parts)
 
-    city = ""
-    if "city" in CONTACT_FIELDS:
-        city = get_answer_value(answer_map.get(CONTACT_FIELDS["city"], {}))
-
-    state = ""
-    if "state" in CONTACT_FIELDS:
-        state = get_answer_value(answer_map.get(CONTACT_FIELDS["state"], {}))
+    city = get_answer_value(slots.get("city", _NO_ANSWER))
+    state = get_answer_value(slots.get("state", _NO_ANSWER))
 
-    # Extract capability levels
+    # Extract capability levels (many partials never reached these questions)
     capabilities = {}
-    for field_id, short_name in CAPABILITY_FIELDS.items():
-        answer = answer_map.get(field_id, {})
-        label = answer.get("choice", {}).get("label", "")
-        level = extract_level(label)
-        if level:
-            capabilities[short_name] = level
+    if not _CAP_NAME_SET.isdisjoint(slots):
+        for short_name in _CAP_NAMES:
+            answer = slots.get(short_name)
+            if answer is None:
+                continue
+            level = extract_level(_choice_label(answer))
+            if level:
+                capabilities[short_name] = level
 
     # Build capability string
-    cap_parts = []
-    for name, level in capabilities.items():
-        cap_parts.append(f"{name}: {level}")
-    cap_string = ", ".join(cap_parts) if cap_parts else ""
+    cap_string = ", ".join([f"{name}: {level}" for name, level in capabilities.items()])
 
     # Extract preferences
-    rel_label = answer_map.get(FIELD_RELATIONAL, {}).get("choice", {}).get("label", "")
+    rel_label = _choice_label(slots.get("relational"))
     relational = map_select(rel_label, RELATIONAL_MAP)
 
-    aut_label = answer_map.get(FIELD_AUTONOMY, {}).get("choice", {}).get("label", "")
+    aut_label = _choice_label(slots.get("autonomy"))
     autonomy = map_select(aut_label, AUTONOMY_MAP)
 
     # Extract communication preference (SMS or Email)
     comm_preference = None
-    if FIELD_COMM_PREFERENCE:
-        comm_label = answer_map.get(FIELD_COMM_PREFERENCE, {}).get("choice", {}).get("label", "")
+    if "comm_preference" in slots:
+        comm_label = _choice_label(slots["comm_preference"])
         comm_preference = map_select(comm_label, COMM_PREFERENCE_MAP)
 
     # Build structured profile fields from remaining answers
-    known_ids = set(CAPABILITY_FIELDS.keys()) | {
-        FIELD_FIRST_NAME, FIELD_LAST_NAME, FIELD_EMAIL,
-        FIELD_RELATIONAL, FIELD_AUTONOMY,
-    } | set(CONTACT_FIELDS.values())
-    if FIELD_COMM_PREFERENCE:
-        known_ids.add(FIELD_COMM_PREFERENCE)
-
     profile_data = {}  # internal_key -> list of (sub_label, value)
 
-    for a in answers:
-        fid = a.get("field", {}).get("id", "")
-        if fid in known_ids or not fid:
-            continue
-
+    for fid, a in profile_answers:
         value = extract_answer_text(a)
-        if not value or value.lower() in ("n/a", "none", "0", "", "i don't have any pets."):
+        if not value or value.lower() in _SKIP_PROFILE_VALUES:
             continue
 
         # Route to the correct profile property
@@ -913,16 +1350,18 @@ def parse_response(item):
     has_profile = any(profile_fields.values())
     has_data = bool(cap_string or relational or autonomy or email or phone or address or city or has_profile)
     if not has_data:
-        if not completed:
-            name = f"{first_name} {last_name}".strip()
-            print(f"  [debug] Partial '{name}' skipped (no data): email={email}, phone={phone}, "
-                  f"caps={bool(cap_string)}, addr={bool(address)}")
+        _log_no_data(first_name, last_name, completed, email, phone, cap_string, address)
         return None
 
+    name = f"{first_name} {last_name}".strip()
     return {
-        "name": f"{first_name} {last_name}".strip(),
+        "name": name,
         "first": first_name,
         "last": last_name,
+        # Lowercased once here for SKIP_NAMES, dedup and Notion matching
+        "name_lc": _normalize_name(name),
+        "first_lc": first_name.lower(),
+        "last_lc": last_name.lower(),
         "email": email,
         "phone": phone,
         "address": address,
@@ -939,48 +1378,69 @@ def parse_response(item):
     }
 
 
+def _normalize_name(name):
+    """Lowercase a name and collapse runs of whitespace."""
+    return _WS_RE.sub(' ', name.lower().strip())
+
+
+def _dedup_key(record):
+    """Key for collapsing repeat submissions: the email (case-insensitive), or
+    for records without one the normalized name (response_id alone would never dedup, defeating
+    the purpose)."""
+    if record["email"]:
+        return record["email"].lower()
+    return f"nomail|{record['name_lc']}"
+
+
+# ============================================================================
+# Sync state
+# ============================================================================
+
+def load_sync_state():
+    """Read .sync_state.json, or an empty state if there is none (or it is
+    unreadable — the run then just re-syncs everything)."""
+    try:
+        with open(STATE_PATH, "rb") as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return {"responses": {}}
+
+
+def save_sync_state(state):
+    """Write the state atomically so an interrupted run can't leave a torn file."""
+    tmp_path = STATE_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(state))
+    os.replace(tmp_path, STATE_PATH)
+
+
+def _record_hash(record):
+    """Stable content hash of a parsed record."""
+    data = json.dumps(record, sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
 # ============================================================================
 # Data integrity verification
 # ============================================================================
 
-def fetch_all_notion_clients():
-    """Fetch all client records from Notion with all field values."""
-    all_results = []
-    cursor = None
-    while True:
-        body = {"page_size": 100}
-        if cursor:
-            body["start_cursor"] = cursor
-        data_body = json.dumps(body).encode()
-        req = urllib.request.Request(
-            f"https://api.notion.com/v1/databases/{NOTION_DB_ID}/query",
-            data=data_body, method="POST",
-            headers={
-                "Authorization": f"Bearer {NOTION_TOKEN}",
-                "Notion-Version": "2022-06-28",
-                "Content-Type": "application/json"
-            }
-        )
-        resp = urllib.request.urlopen(req)
-        data = json.loads(resp.read().decode())
-        all_results.extend(data.get("results", []))
-        if data.get("has_more"):
-            cursor = data["next_cursor"]
-        else:
-            break
-        time.sleep(0.35)
-    return all_results
+# Standard capability string, e.g. "Cleaning: L2, Laundry: N/A"
+_CAP_FORMAT_RE = re.compile(r'^([A-Za-z &]+: (L[1-4]|N/A)(, )?)+$')
+
+
+# Property type -> plain value of a Notion property of that type ("" if unset)
+_VALUE_EXTRACTORS = {
+    "email": lambda prop: prop.get("email", "") or "",
+    "phone_number": lambda prop: prop.get("phone_number", "") or "",
+    "rich_text": lambda prop: _rt(prop.get("rich_text", [])).strip(),
+    "select": lambda prop: (prop.get("select") or {}).get("name", ""),
+}
 
 
 def verify_data():
     """Check data integrity across all Notion client records."""
     print("=== Data Integrity Check ===\n")
 
-    # Step 1: Fetch all clients
-    print("[1] Fetching all Notion clients...")
-    all_results = fetch_all_notion_clients()
-    print(f"  Found {len(all_results)} total client records\n")
-
     # Define all tracked fields
     core_fields = [
         ("Email", "email"),
@@ -997,172 +1457,160 @@ def verify_data():
     profile_fields = [(prop, "rich_text") for prop in PROFILE_NOTION_PROPERTIES.values()]
 
     all_fields = core_fields + profile_fields + [("Typeform Status", "select")]
-
-    # Step 2: Analyze each client
-    field_stats = {f[0]: {"filled": 0, "empty": 0, "truncated": 0} for f in all_fields}
-    complete_clients = []
-    partial_clients = []
-    no_form_clients = []
+    critical_fields = ["Capability Requirements", "Relational Preference", "Decision Autonomy"]
+    high_value_keys = ("household_members", "pets", "home_size", "pain_points",
+                       "preferred_hours", "special_considerations", "routines")
+    high_value_props = tuple(PROFILE_NOTION_PROPERTIES[k] for k in high_value_keys)
+    extractors = [(field_name, _VALUE_EXTRACTORS[field_type]) for field_name, field_type in all_fields]
+
+    # Step 1: Fetch all clients (streamed page by page into step 2, unless
+    # --incremental merges edits into the local snapshot first). Every client
+    # counts towards the fill rates, so there is nothing to filter out
+    # server-side — but Notion can leave out the properties we never read.
+    print("[1] Fetching all Notion clients...")
+    property_ids = _property_ids(["Task name"] + [field_name for field_name, _ in all_fields])
+    if INCREMENTAL_MODE:
+        clients = iter_cached_notion_clients(property_ids)
+    else:
+        # A full check drops the snapshot, archived pages and all
+        try:
+            os.remove(VERIFY_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+        clients = iter_notion_clients(property_ids=property_ids)
+    # Positions in all_fields, so per-client values and stats are plain lists
+    position = {field_name: i for i, (field_name, _) in enumerate(all_fields)}
+    critical_positions = [(cf, position[cf]) for cf in critical_fields]
+    high_value_positions = tuple(position[prop_name] for prop_name in high_value_props)
+    cap_position = position["Capability Requirements"]
+
+    # Step 2: Analyze each client as it arrives — one pass collects everything
+    # the report sections below need, and no page is kept once it's counted
+    total = 0
+    filled_counts = [0] * len(all_fields)
+    empty_counts = [0] * len(all_fields)
+    truncated_counts = [0] * len(all_fields)
+    status_counts = Counter()  # Typeform Status -> number of clients
     issues = []
+    bad_caps = []  # (name, capability string) not in the standard format
+    profile_scores = []  # (name, score, filled count) for complete-form clients
 
-    for page in all_results:
+    for page in clients:
+        total += 1
         props = page.get("properties", {})
-        title_parts = props.get("Task name", {}).get("title", [])
-        name = "".join(t.get("plain_text", "") for t in title_parts).strip()
+        name = _get_notion_name(props).strip()
 
         tf_status = (props.get("Typeform Status", {}).get("select") or {}).get("name", "")
 
-        if tf_status == "Complete":
-            complete_clients.append(name)
-        elif tf_status == "Partial":
-            partial_clients.append(name)
-        else:
-            no_form_clients.append(name)
-
-        for field_name, field_type in all_fields:
-            prop = props.get(field_name, {})
-            value = ""
-
-            if field_type == "email":
-                value = prop.get("email", "") or ""
-            elif field_type == "phone_number":
-                value = prop.get("phone_number", "") or ""
-            elif field_type == "rich_text":
-                rt = prop.get("rich_text", [])
-                value = "".join(t.get("plain_text", "") for t in rt).strip()
-            elif field_type == "select":
-                value = (prop.get("select") or {}).get("name", "")
+        status_counts[tf_status] += 1
 
+        values = [extract(props.get(field_name, {})) for field_name, extract in extractors]
+        for i, value in enumerate(values):
             if value:
-                field_stats[field_name]["filled"] += 1
+                filled_counts[i] += 1
                 if len(value) >= 1990:
-                    field_stats[field_name]["truncated"] += 1
+                    truncated_counts[i] += 1
             else:
-                field_stats[field_name]["empty"] += 1
+                empty_counts[i] += 1
 
-        # Check complete-form clients for missing critical fields
         if tf_status == "Complete":
-            critical = ["Capability Requirements", "Relational Preference", "Decision Autonomy"]
-            missing_critical = []
-            for cf in critical:
-                prop = props.get(cf, {})
-                if cf in ("Relational Preference", "Decision Autonomy"):
-                    val = (prop.get("select") or {}).get("name", "")
-                else:
-                    val = "".join(t.get("plain_text", "") for t in prop.get("rich_text", [])).strip()
-                if not val:
-                    missing_critical.append(cf)
+            # Missing critical fields
+            missing_critical = [cf for cf, i in critical_positions if not values[i]]
             if missing_critical:
                 issues.append((name, missing_critical))
 
-    total = len(all_results)
-
-    # Step 3: Report
-    print(f"[2] Typeform Status Distribution:")
-    print(f"  Complete:  {len(complete_clients)}")
-    print(f"  Partial:   {len(partial_clients)}")
-    print(f"  No form:   {len(no_form_clients)}")
-    print()
-
-    print(f"[3] Field Fill Rates (across {total} clients):")
-    print(f"  {'Field':<28} {'Filled':>7} {'Empty':>7} {'Rate':>6} {'Trunc':>6}")
-    print(f"  {'-' * 56}")
+            # Profile completeness
+            filled_count = sum(1 for i in high_value_positions if values[i])
+            score = (filled_count / len(high_value_props)) * 100
+            profile_scores.append((name, score, filled_count))
+
+        cap_val = values[cap_position]
+        if cap_val and not _CAP_FORMAT_RE.match(cap_val):
+            bad_caps.append((name, cap_val))
+
+    # The report is a few dozen short lines — build it in memory and write
+    # it out in one go rather than one write per line
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        print(f"  Found {total} total client records\n")
+        complete_count = status_counts["Complete"]
+        partial_count = status_counts["Partial"]
+
+        # Step 3: Report
+        print(f"[2] Typeform Status Distribution:")
+        print(f"  Complete:  {complete_count}")
+        print(f"  Partial:   {partial_count}")
+        print(f"  No form:   {total - complete_count - partial_count}")
+        print()
 
-    for field_name, _ in all_fields:
-        stats = field_stats[field_name]
-        filled = stats["filled"]
-        empty = stats["empty"]
-        rate = (filled / total * 100) if total > 0 else 0
-        trunc = stats["truncated"]
+        print(f"[3] Field Fill Rates (across {total} clients):")
+        print(f"  {'Field':<28} {'Filled':>7} {'Empty':>7} {'Rate':>6} {'Trunc':>6}")
+        print(f"  {'-' * 56}")
 
-        flags = ""
-        if trunc > 0:
-            flags += " [TRUNCATED]"
+        for i, (field_name, _) in enumerate(all_fields):
+            filled = filled_counts[i]
+            empty = empty_counts[i]
+            rate = (filled / total * 100) if total > 0 else 0
+            trunc = truncated_counts[i]
 
-        print(f"  {field_name:<28} {filled:>7} {empty:>7} {rate:>5.0f}% {trunc:>5}{flags}")
+            flags = ""
+            if trunc > 0:
+                flags += " [TRUNCATED]"
 
-    # Step 4: Critical field integrity
-    print(f"\n[4] Critical Field Integrity (Complete-form clients):")
-    if not issues:
-        print(f"  All {len(complete_clients)} complete-form clients have critical fields populated")
-    else:
-        for name, missing_fields in issues:
-            print(f"  MISSING  {name}: {', '.join(missing_fields)}")
-        print(f"\n  {len(issues)} of {len(complete_clients)} complete-form clients have gaps")
-
-    # Step 5: Capability format check
-    print(f"\n[5] Capability Format Consistency:")
-    valid_pattern = re.compile(r'^([A-Za-z &]+: (L[1-4]|N/A)(, )?)+$')
-    bad_caps = 0
-    for page in all_results:
-        props = page.get("properties", {})
-        cap_rt = props.get("Capability Requirements", {}).get("rich_text", [])
-        cap_val = "".join(t.get("plain_text", "") for t in cap_rt).strip()
-        if cap_val and not valid_pattern.match(cap_val):
-            title_parts = props.get("Task name", {}).get("title", [])
-            name = "".join(t.get("plain_text", "") for t in title_parts).strip()
-            print(f"  NON-STANDARD  {name}: {cap_val[:60]}...")
-            bad_caps += 1
-
-    if bad_caps == 0:
-        print(f"  All capability strings use standard L1-L4/N/A format")
-
-    # Step 6: Profile completeness for complete-form clients
-    print(f"\n[6] Profile Completeness (Complete-form clients):")
-    high_value_keys = ["household_members", "pets", "home_size", "pain_points",
-                       "preferred_hours", "special_considerations", "routines"]
-    high_value_props = [PROFILE_NOTION_PROPERTIES[k] for k in high_value_keys]
-
-    profile_scores = []
-    for page in all_results:
-        props = page.get("properties", {})
-        tf_status = (props.get("Typeform Status", {}).get("select") or {}).get("name", "")
-        if tf_status != "Complete":
-            continue
+            print(f"  {field_name:<28} {filled:>7} {empty:>7} {rate:>5.0f}% {trunc:>5}{flags}")
 
-        filled_count = 0
-        for prop_name in high_value_props:
-            rt = props.get(prop_name, {}).get("rich_text", [])
-            val = "".join(t.get("plain_text", "") for t in rt).strip()
-            if val:
-                filled_count += 1
-
-        score = (filled_count / len(high_value_props)) * 100
-        title_parts = props.get("Task name", {}).get("title", [])
-        name = "".join(t.get("plain_text", "") for t in title_parts).strip()
-        profile_scores.append((name, score, filled_count))
-
-    if profile_scores:
-        avg_score = sum(s[1] for s in profile_scores) / len(profile_scores)
-        full_profiles = sum(1 for s in profile_scores if s[1] == 100)
-        empty_profiles = sum(1 for s in profile_scores if s[1] == 0)
-
-        print(f"  Average profile completeness: {avg_score:.0f}%")
-        print(f"  Fully populated: {full_profiles}/{len(profile_scores)}")
-        print(f"  Empty profiles:  {empty_profiles}/{len(profile_scores)}")
-
-        # Show clients with incomplete profiles
-        incomplete = [(n, s, c) for n, s, c in profile_scores if 0 < s < 100]
-        if incomplete:
-            print(f"\n  Partially complete profiles:")
-            for name, score, count in sorted(incomplete, key=lambda x: x[1]):
-                print(f"    {name}: {score:.0f}% ({count}/{len(high_value_props)} high-value fields)")
-
-        if empty_profiles > 0:
-            print(f"\n  Clients with zero profile data (may need re-sync):")
-            for name, score, _ in profile_scores:
-                if score == 0:
-                    print(f"    {name}")
-    else:
-        print(f"  No complete-form clients found")
+        # Step 4: Critical field integrity
+        print(f"\n[4] Critical Field Integrity (Complete-form clients):")
+        if not issues:
+            print(f"  All {complete_count} complete-form clients have critical fields populated")
+        else:
+            for name, missing_fields in issues:
+                print(f"  MISSING  {name}: {', '.join(missing_fields)}")
+            print(f"\n  {len(issues)} of {complete_count} complete-form clients have gaps")
+
+        # Step 5: Capability format check
+        print(f"\n[5] Capability Format Consistency:")
+        for name, cap_val in bad_caps:
+            print(f"  NON-STANDARD  {name}: {cap_val:.60}...")
+
+        if not bad_caps:
+            print(f"  All capability strings use standard L1-L4/N/A format")
+
+        # Step 6: Profile completeness for complete-form clients
+        print(f"\n[6] Profile Completeness (Complete-form clients):")
+        if profile_scores:
+            avg_score = sum(s[1] for s in profile_scores) / len(profile_scores)
+            full_profiles = sum(1 for s in profile_scores if s[1] == 100)
+            empty_profiles = sum(1 for s in profile_scores if s[1] == 0)
+
+            print(f"  Average profile completeness: {avg_score:.0f}%")
+            print(f"  Fully populated: {full_profiles}/{len(profile_scores)}")
+            print(f"  Empty profiles:  {empty_profiles}/{len(profile_scores)}")
+
+            # Show clients with incomplete profiles
+            incomplete = [(n, s, c) for n, s, c in profile_scores if 0 < s < 100]
+            if incomplete:
+                print(f"\n  Partially complete profiles:")
+                for name, score, count in sorted(incomplete, key=itemgetter(1)):
+                    print(f"    {name}: {score:.0f}% ({count}/{len(high_value_props)} high-value fields)")
+
+            if empty_profiles > 0:
+                print(f"\n  Clients with zero profile data (may need re-sync):")
+                for name, score, _ in profile_scores:
+                    if score == 0:
+                        print(f"    {name}")
+        else:
+            print(f"  No complete-form clients found")
 
-    print(f"\n{'=' * 60}")
-    print(f"  SUMMARY: {total} clients, {len(complete_clients)} with complete forms")
-    if profile_scores:
-        avg = sum(s[1] for s in profile_scores) / len(profile_scores)
-        print(f"  Profile data health: {avg:.0f}% average completeness")
-    print(f"  Critical field issues: {len(issues)}")
-    print(f"{'=' * 60}")
+        print(f"\n{'=' * 60}")
+        print(f"  SUMMARY: {total} clients, {complete_count} with complete forms")
+        if profile_scores:
+            avg = sum(s[1] for s in profile_scores) / len(profile_scores)
+            print(f"  Profile data health: {avg:.0f}% average completeness")
+        print(f"  Critical field issues: {len(issues)}")
+        print(f"{'=' * 60}")
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
 
 
 # ============================================================================
@@ -1171,11 +1619,13 @@ def verify_data():
 
 def main():
     print("=== Typeform V2 -> Notion Sync (Structured) ===\n")
+    run_started = time.time()
+    state = load_sync_state()
 
     # Step 0: Fetch form definition for profile field routing
     print("[0] Fetching form definition for profile field mapping...")
     try:
-        fetch_form_definition()
+        fetch_form_definition(state.setdefault("form", {}))
     except Exception as e:
         print(f"  WARNING: Could not fetch form definition: {e}")
         print("  Profile fields will route to catch-all")
@@ -1191,153 +1641,246 @@ def main():
         sys.exit(1)
     print()
 
-    # Step 1: Fetch all typeform responses
-    responses = fetch_typeform_responses()
+    # Step 1: Fetch typeform responses — everything, or on incremental runs
+    # only what arrived since the last clean run
+    since = None
+    if INCREMENTAL_MODE and state.get("last_sync"):
+        since = time.strftime("%Y-%m-%dT%H:%M:%SZ",
+                              time.gmtime(state["last_sync"] - SINCE_OVERLAP_SECS))
+        print(f"[1] Incremental: fetching responses since {since}")
+    elif INCREMENTAL_MODE:
+        print("[1] Incremental: no previous clean run recorded — fetching everything")
+    responses = fetch_typeform_responses(since)
 
     # Step 1b: Discover contact field IDs from response data
     print("\n[1b] Discovering contact fields from response data...")
     discover_contact_fields(responses)
     print()
 
-    # Step 2: Parse and match
-    parsed = []
+    # Step 2: Parse and deduplicate in one pass: prefer completed over
+    # partial, then latest submission
+    by_key = {}
     skipped_no_data = 0
     for item in responses:
-        record = parse_response(item)
-        if record:
-            parsed.append(record)
-        else:
+        r = parse_response(item)
+        if not r:
             skipped_no_data += 1
-
-    # Deduplicate: prefer completed over partial, then latest submission
-    # For records without email, use normalized name to collapse duplicates
-    # (response_id alone would never dedup, defeating the purpose)
-    by_key = {}
-    for r in parsed:
-        if r["email"]:
-            key = r["email"]
-        else:
-            normalized = re.sub(r'\s+', ' ', r['name'].lower().strip())
-            key = f"nomail|{normalized}"
+            continue
+        key = _dedup_key(r)
         existing = by_key.get(key)
-        if not existing:
-            by_key[key] = r
-        elif r["completed"] and not existing["completed"]:
-            by_key[key] = r
-        elif r["completed"] == existing["completed"] and r["submitted"] > existing["submitted"]:
+        if not existing or (r["completed"], r["submitted"]) > (existing["completed"], existing["submitted"]):
             by_key[key] = r
 
+    # The raw responses aren't needed past this point — let them go before
+    # the Notion phase rather than holding every answer list for the whole run
+    del responses
+
     records = list(by_key.values())
     complete_count = sum(1 for r in records if r["completed"])
     partial_count = len(records) - complete_count
     print(f"Unique records: {len(records)} ({complete_count} complete, {partial_count} partial)")
     if skipped_no_data:
         print(f"Skipped {skipped_no_data} responses with no usable data")
+
+    # Hash before matching — spouse attribution rewrites profile fields below
+    hashes = {r["response_id"]: _record_hash(r) for r in records}
+    synced_hashes = {} if FULL_MODE else state.get("responses", {})
+    synced = {}  # response_id -> hash, for everything Notion now reflects
+    print()
+
+    # Step 3: Load every Notion client once, then match and update locally.
+    # Matching needs the whole database, but only if something changed — when
+    # every response is already synced the scan is skipped entirely
+    pending = sum(1 for r in records
+                  if r["name_lc"] not in SKIP_NAMES
+                  and synced_hashes.get(r["response_id"]) != hashes[r["response_id"]])
+    if pending:
+        print("[3] Loading Notion clients...")
+        notion_index = load_notion_index()
+    else:
+        print("[3] Every response is already synced — skipping the Notion client scan")
+        notion_index = None
     print()
 
-    # Step 3: Match and update
     updated = 0
     created = 0
     not_found = 0
     skipped = 0
+    unchanged = 0
+    cached = 0
+    failed = 0  # create/write errors — these hold the incremental window back
+
+    # Matching, creates and deciding what to write run serially (each record
+    # can depend on earlier ones); the PATCHes go out through a small pool.
+    # Each record's log lines are buffered and printed, in order, as soon as
+    # its write (if any) has finished.
+    writes = deque()  # (log buffer, PATCH future or None, written fields, response_id)
+    pending_writes = {}  # page_id -> latest PATCH future for that page
+
+    def flush_logs(block=False):
+        """Print the finished record blocks at the head of the queue, one write
+        per block; with block=True, wait for every outstanding PATCH."""
+        nonlocal updated, skipped, failed
+        printed = False
+        while writes and (block or writes[0][1] is None or writes[0][1].done()):
+            log, write, written, rid = writes.popleft()
+            if write is not None:
+                try:
+                    write.result()
+                    log.write(f"  UPDATED: {', '.join(written)}\n")
+                    updated += 1
+                    synced[rid] = hashes[rid]
+                except Exception as e:
+                    log.write(f"  ERROR: {e}\n")
+                    skipped += 1
+                    failed += 1
+                log.write("\n")
+            sys.stdout.write(log.getvalue())
+            printed = True
+        if printed:
+            sys.stdout.flush()
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        try:
+            for r in records:
+                flush_logs()
+                log = io.StringIO()
+                writes.append((log, None, None, None))
+                rid = r["response_id"]
+                # Skip known test entries and non-clients
+                if r["name_lc"] in SKIP_NAMES:
+                    skipped += 1
+                    continue
 
-    for r in records:
-        # Skip known test entries and non-clients
-        clean_name = re.sub(r'\s+', ' ', r["name"].lower().strip())
-        if clean_name in SKIP_NAMES:
-            skipped += 1
-            continue
+                # Same content as the last successful sync of this response
+                if synced_hashes.get(rid) == hashes[rid]:
+                    synced[rid] = hashes[rid]
+                    cached += 1
+                    continue
 
-        status_tag = "COMPLETE" if r["completed"] else "PARTIAL"
-        # Redact name in logs: show first initial + last name initial only
-        name_parts = r['name'].split()
-        redacted_name = f"{name_parts[0][0]}. {name_parts[-1][0]}." if len(name_parts) >= 2 else f"{r['name'][0]}."
-        print(f"-- {redacted_name} ({r['submitted']}) [{status_tag}] --")
-        if r["capabilities"]:
-            print(f"  Caps: {r['capabilities'][:70]}...")
-        else:
-            print(f"  Caps: (none)")
-        print(f"  Rel: {r['relational']} | Aut: {r['autonomy']} | Comm: {r.get('comm_preference', '(none)')}")
-
-        # Show contact info in logs (redacted — full PII stays out of CI logs)
-        contact_parts = []
-        if r["email"]:
-            domain = r["email"].split("@")[-1] if "@" in r["email"] else "?"
-            contact_parts.append(f"email=***@{domain}")
-        if r["phone"]:
-            contact_parts.append(f"phone=***{r['phone'][-4:]}")
-        if r["address"]:
-            contact_parts.append("addr=yes")
-        if r["city"]:
-            contact_parts.append(f"city={r['city']}")
-        if contact_parts:
-            print(f"  Contact: {', '.join(contact_parts)}")
-
-        # Show profile fields in logs
-        pf = r.get("profile_fields", {})
-        if pf:
-            filled = [PROFILE_NOTION_PROPERTIES.get(k, k) for k in pf if pf[k]]
-            print(f"  Profile: {len(filled)} fields ({', '.join(filled[:4])}{'...' if len(filled) > 4 else ''})")
-
-        page_id, notion_name, current, match_type = find_notion_client(
-            r["email"], r["last"], r["first"], r["address"])
-        time.sleep(0.35)
-
-        if not page_id:
-            # No match — create new client row
-            if r["completed"]:
-                print(f"  NEW CLIENT — creating Notion row...")
-                try:
-                    new_id = create_notion_client(r)
-                    if new_id:
-                        print(f"  CREATED: {r['name']} (page {new_id[:8]}...)")
-                        created += 1
+                status_tag = "COMPLETE" if r["completed"] else "PARTIAL"
+                # Redact name in logs: show first initial + last name initial only
+                name_parts = r['name'].split()
+                redacted_name = f"{name_parts[0][0]}. {name_parts[-1][0]}." if len(name_parts) >= 2 else f"{r['name'][0]}."
+                print(f"-- {redacted_name} ({r['submitted']}) [{status_tag}] --", file=log)
+                if r["capabilities"]:
+                    print(f"  Caps: {r['capabilities']:.70}...", file=log)
+                else:
+                    print(f"  Caps: (none)", file=log)
+                print(f"  Rel: {r['relational']} | Aut: {r['autonomy']} | Comm: {r.get('comm_preference', '(none)')}", file=log)
+
+                # Show contact info in logs (redacted — full PII stays out of CI logs)
+                contact_parts = []
+                if r["email"]:
+                    domain = r["email"].split("@")[-1] if "@" in r["email"] else "?"
+                    contact_parts.append(f"email=***@{domain}")
+                if r["phone"]:
+                    contact_parts.append(f"phone=***{r['phone'][-4:]}")
+                if r["address"]:
+                    contact_parts.append("addr=yes")
+                if r["city"]:
+                    contact_parts.append(f"city={r['city']}")
+                if contact_parts:
+                    print(f"  Contact: {', '.join(contact_parts)}", file=log)
+
+                # Show profile fields in logs
+                pf = r.get("profile_fields", {})
+                if pf:
+                    filled = [PROFILE_NOTION_PROPERTIES.get(k, k) for k in pf if pf[k]]
+                    print(f"  Profile: {len(filled)} fields ({', '.join(filled[:4])}{'...' if len(filled) > 4 else ''})", file=log)
+
+                page_id, notion_name, current, match_type = find_notion_client(
+                    notion_index, r["email"], r["last_lc"], r["first_lc"], r["address"], log)
+
+                if not page_id:
+                    # No match — create new client row
+                    if r["completed"]:
+                        print(f"  NEW CLIENT — creating Notion row...", file=log)
+                        try:
+                            page = create_notion_client(r)
+                            new_id = page and page.get("id")
+                            if new_id:
+                                _index_client(notion_index, page)
+                                print(f"  CREATED: {r['name']} (page {new_id:.8}...)", file=log)
+                                created += 1
+                                synced[rid] = hashes[rid]
+                            else:
+                                print(f"  CREATE FAILED: no page ID returned", file=log)
+                                not_found += 1
+                                failed += 1
+                        except Exception as e:
+                            print(f"  CREATE ERROR: {e}", file=log)
+                            not_found += 1
+                            failed += 1
                     else:
-                        print(f"  CREATE FAILED: no page ID returned")
+                        print(f"  NOT FOUND (skipping create: partial response)", file=log)
                         not_found += 1
-                except Exception as e:
-                    print(f"  CREATE ERROR: {e}")
-                    not_found += 1
-            else:
-                print(f"  NOT FOUND (skipping create: partial response)")
-                not_found += 1
-            print()
-            continue
+                    print(file=log)
+                    continue
 
-        print(f"  -> Notion: {notion_name}")
+                print(f"  -> Notion: {notion_name}", file=log)
 
-        # For spouse matches, add attribution to profile fields so team knows who said what
-        if match_type == "spouse":
-            spouse_name = r["first"] or r["name"]
-            for key in r.get("profile_fields", {}):
-                value = r["profile_fields"][key]
-                if value:
-                    r["profile_fields"][key] = f"[From {spouse_name}] {value}"
-            # Add spouse email as partner email if not already set
-            if r["email"] and not current.get("partner_email"):
-                r["_partner_email"] = r["email"]
+                # A full run would have preferred this client's completed
+                # response over a later partial one; an incremental run never
+                # sees the older response, so don't let the partial replace it
+                if since and not r["completed"] and current.get("typeform_status") == "Complete":
+                    print("  SKIPPED (partial response, client already Complete)", file=log)
+                    skipped += 1
+                    synced[rid] = hashes[rid]
+                    print(file=log)
+                    continue
 
-        try:
-            success, written = update_notion(page_id, r, current)
-            if written:
-                print(f"  UPDATED: {', '.join(written)}")
-                updated += 1
-            else:
-                print(f"  SKIPPED (no new data to write)")
-                skipped += 1
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            skipped += 1
+                # For spouse matches, add attribution to profile fields so team knows who said what
+                if match_type == "spouse":
+                    spouse_name = r["first"] or r["name"]
+                    for key in r.get("profile_fields", {}):
+                        value = r["profile_fields"][key]
+                        if value:
+                            r["profile_fields"][key] = f"[From {spouse_name}] {value}"
+                    # Add spouse email as partner email if not already set
+                    if r["email"] and not current.get("partner_email"):
+                        r["_partner_email"] = r["email"]
+
+                properties = build_notion_update(r, current)
+                if not properties:
+                    print(f"  SKIPPED (no new data to write)", file=log)
+                    skipped += 1
+                    synced[rid] = hashes[rid]
+                    print(file=log)
+                    continue
+                properties = _changed_properties(properties, current)
+                if not properties:
+                    print("  UNCHANGED (Notion already up to date)", file=log)
+                    unchanged += 1
+                    synced[rid] = hashes[rid]
+                    print(file=log)
+                    continue
 
-        time.sleep(0.35)
-        print()
+                # Reflect the write in the cached values now, so a later record for the
+                # same client (e.g. a spouse) builds on it exactly as if it had re-read Notion
+                _apply_written_values(current, properties)
+                write = executor.submit(_patch_after, pending_writes.get(page_id), page_id, properties)
+                pending_writes[page_id] = write
+                writes[-1] = (log, write, [k for k in properties if k != "Typeform Status"] or list(properties), rid)
+        finally:
+            flush_logs(block=True)
 
     print(f"\n=== DONE ===")
-    print(f"Updated: {updated} | Created: {created} | Not found: {not_found} | Skipped: {skipped}")
+    print(f"Updated: {updated} | Created: {created} | Not found: {not_found} | Skipped: {skipped} | Unchanged: {unchanged}")
+    print(f"Already synced (unchanged since last run): {cached}")
     print(f"Total unique responses processed: {len(records)}")
 
-    # Exit with error code if nothing succeeded
-    if updated == 0 and created == 0 and len(records) > 0:
+    # An incremental run only saw recent responses — keep the rest of the state
+    state["responses"] = {**synced_hashes, **synced} if since else synced
+    # Only a clean run moves the incremental window forward, so anything that
+    # failed to write is fetched again next time
+    if failed == 0:
+        state["last_sync"] = run_started
+    save_sync_state(state)
+
+    # Exit with error code if nothing succeeded (records already in sync count
+    # as success — otherwise every steady-state run would look like a failure)
+    if updated == 0 and created == 0 and unchanged == 0 and cached == 0 and len(records) > 0:
         sys.exit(1)
 
 
@@ -1363,10 +1906,8 @@ def preflight():
 
     for first, last, notion_name, expected, desc in test_cases:
         notion_lower = notion_name.lower()
-        has_first = bool(first and re.search(
-            r'\b' + re.escape(first.lower()) + r'\b', notion_lower))
-        has_last = bool(last and re.search(
-            r'\b' + re.escape(last.lower()) + r'\b', notion_lower))
+        has_first = bool(first and _word_re(first.lower()).search(notion_lower))
+        has_last = bool(last and _word_re(last.lower()).search(notion_lower))
         matched = has_first and has_last
 
         status = "PASS" if matched == expected else "FAIL"
@@ -1403,21 +1944,21 @@ def preflight():
     # Test 4: Dedup key uniqueness
     print("\n[4] Testing dedup key logic...")
     # Two records with same name but no email SHOULD collapse (same person submitting twice)
-    r1 = {"email": "", "name": "John Smith", "response_id": "abc123"}
-    r2 = {"email": "", "name": "John Smith", "response_id": "def456"}
-    key1 = r1["email"] if r1["email"] else f"nomail|{r1['name'].lower().strip()}"
-    key2 = r2["email"] if r2["email"] else f"nomail|{r2['name'].lower().strip()}"
+    r1 = {"email": "", "name_lc": _normalize_name("John Smith"), "response_id": "abc123"}
+    r2 = {"email": "", "name_lc": _normalize_name("john  Smith "), "response_id": "def456"}
+    key1 = _dedup_key(r1)
+    key2 = _dedup_key(r2)
     if key1 != key2:
         failures.append("Dedup: same-name records without email should collapse but don't")
         print("  FAIL: same-name no-email records don't collapse")
     else:
         print(f"  PASS: same-name no-email records collapse correctly")
 
-    # Two records with same email should collapse (intended)
-    r3 = {"email": "john@example.com", "name": "John Smith", "response_id": "abc"}
-    r4 = {"email": "john@example.com", "name": "John A Smith", "response_id": "def"}
-    key3 = r3["email"] if r3["email"] else f"nomail|{r3['name'].lower().strip()}"
-    key4 = r4["email"] if r4["email"] else f"nomail|{r4['name'].lower().strip()}"
+    # Two records with same email should collapse (intended), whatever its case
+    r3 = {"email": "john@example.com", "name_lc": _normalize_name("John Smith"), "response_id": "abc"}
+    r4 = {"email": "John@Example.com", "name_lc": _normalize_name("John A Smith"), "response_id": "def"}
+    key3 = _dedup_key(r3)
+    key4 = _dedup_key(r4)
     if key3 != key4:
         failures.append("Dedup: same-email records should collapse but don't")
         print("  FAIL: same-email records don't collapse")
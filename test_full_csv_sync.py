@@ -0,0 +1,54 @@
+"""Offline checks for full_csv_sync.py (no Notion calls). Run with:
+    python -m unittest test_full_csv_sync
+"""
+import csv
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("NOTION_TOKEN", "test")  # full_csv_sync exits at import without one
+
+import full_csv_sync as fcs
+
+
+class ScanV2EmailsTest(unittest.TestCase):
+    def _write_v2(self, rows):
+        header = [fcs.V2_IDENTITY_COLS["first"], fcs.V2_IDENTITY_COLS["last"],
+                  fcs.V2_IDENTITY_COLS["email"]]
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", newline="") as f:
+            csv.writer(f).writerows([header] + rows)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_row_without_first_name_does_not_skip_v1(self):
+        path = self._write_v2([
+            ["Ann", "Lee", "Ann@Example.com"],
+            ["", "Smith", "smith@example.com"],  # parse_v2_row drops this row
+        ])
+        emails = fcs.scan_v2_emails(path)
+        self.assertEqual(emails, frozenset({"ann@example.com"}))
+
+        # The V1 row for the person V2 never syncs must still come through
+        idx = fcs._column_index(["First name", "Last name", "Email"])
+        self.assertIsNotNone(fcs.parse_v1_row(["Bo", "Smith", "smith@example.com"], idx, emails))
+        self.assertIsNone(fcs.parse_v1_row(["Ann", "Lee", "ann@example.com"], idx, emails))
+
+
+class FindMatchTest(unittest.TestCase):
+    def _index(self, *names):
+        clients = {n.lower(): {"page_id": i, "name": n} for i, n in enumerate(names)}
+        return fcs.build_name_index(clients)
+
+    def test_separators_must_match(self):
+        index = self._index("Ann Smith Jones", "Bo O Brien", "Cy Smith-Jones")
+        self.assertEqual(fcs.find_match(index, "Zed", "Smith-Jones")["name"], "Cy Smith-Jones")
+        self.assertIsNone(fcs.find_match(index, "Zed", "O'Brien"))
+
+    def test_whole_words_only_first_in_notion_order(self):
+        index = self._index("Dee Beacraft", "Eve Craft", "Fay Craft")
+        self.assertEqual(fcs.find_match(index, "Zed", "Craft")["name"], "Eve Craft")
+
+
+if __name__ == "__main__":
+    unittest.main()